@@ -35,7 +35,7 @@
 #     url = f"https://www.basketball-reference.com/leagues/NBA_{season}_games.html"
 #     html = await get_html(url, "#content .filter")
     
-#     soup = BeautifulSoup(html)
+#     soup = BeautifulSoup(html, 'lxml')
 #     links = soup.find_all("a")
 #     standings_pages = [f"https://www.basketball-reference.com{l['href']}" for l in links]
     
@@ -52,7 +52,7 @@
 #     with open(standings_file, 'r') as f:
 #         html = f.read()
 
-#     soup = BeautifulSoup(html)
+#     soup = BeautifulSoup(html, 'lxml')
 #     links = soup.find_all("a")
 #     hrefs = [l.get('href') for l in links]
 #     box_scores = [f"https://www.basketball-reference.com{l}" for l in hrefs if l and "boxscore" in l and '.html' in l]
@@ -172,63 +172,189 @@
 ### this also works ###
 import os
 import asyncio
-from bs4 import BeautifulSoup
+import json
+import re
+import aiofiles
+import httpx
+import zstandard as zstd
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 
 SEASONS = list(range(2024,2025))
 
+# The only thing we need from a standings page is its box-score links,
+# so scan the raw bytes instead of building a DOM
+BOX_RE = re.compile(rb'href="(/boxscores/[^"]+\.html)"')
+
+# HTML compresses ~5-8x at level 3; saves disk and later read time
+ZSTD_COMPRESSOR = zstd.ZstdCompressor(level=3)
+
 DATA_DIR = "data"
 STANDINGS_DIR = os.path.join(DATA_DIR, "standings")
 SCORES_DIR = "scores"
 
+# Cookies/session state carried over between runs
+STATE_PATH = os.path.join(DATA_DIR, "browser_state.json")
+
 # Check if the directory exists
 if not os.path.exists(SCORES_DIR):
     # If it doesn't exist, create it
     os.makedirs(SCORES_DIR)
 
-async def get_html(url, selector, sleep=5, retries=3):
-    html = None
-    for i in range(1, retries+1):
-        await asyncio.sleep(sleep * i)
+# Number of browser contexts shared by the whole run
+POOL_SIZE = 4
+
+# Resource types we never need for DOM-only scraping
+BLOCKED_RESOURCES = {"image", "stylesheet", "font", "media"}
+
+async def block_static_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def make_context_pool(browser, size=POOL_SIZE):
+    # One browser, several reusable contexts instead of a launch per URL
+    pool = asyncio.Queue()
+    # Reuse last run's cookies so we don't renegotiate sessions per run
+    storage_state = STATE_PATH if os.path.exists(STATE_PATH) else None
+    for _ in range(size):
+        context = await browser.new_context(storage_state=storage_state)
+        await context.route("**/*", block_static_resources)
+        await pool.put(context)
+    return pool
+
+async def fetch_http(client, url, selector):
+    # Fast path: these pages are server-rendered, so plain HTTP usually works
+    try:
+        response = await client.get(url)
+    except httpx.HTTPError:
+        return None
+    if response.status_code != 200:
+        return None
+    html = response.text
+    # Make sure the element we would have waited for is actually there
+    if f'id="{selector.lstrip("#")}"' not in html:
+        return None
+    return html
+
+async def get_html(pool, client, url, selector, sleep=5, retries=3):
+    html = await fetch_http(client, url, selector)
+    if html:
+        return html
+
+    # Fall back to the browser for pages HTTP couldn't serve (403/429, JS)
+    for i in range(retries):
+        context = await pool.get()
         try:
-            async with async_playwright() as p:
-                browser = await p.firefox.launch(headless=False)
-                page = await browser.new_page()
-                await page.goto(url)
-                html = await page.inner_html(selector=selector)
+            page = await context.new_page()
+            try:
+                await page.goto(url, wait_until='domcontentloaded')
+                # wait_for_selector + content() avoids the in-browser
+                # serialization that inner_html runs per subtree
+                await page.wait_for_selector(selector, state='attached')
+                html = await page.content()
+            finally:
+                await page.close()
         except PlaywrightTimeout:
             print(f"Timeout error on {url}")
-            continue
         else:
             break
+        finally:
+            pool.put_nowait(context)
+        # Back off only after a failed attempt, doubling each time
+        await asyncio.sleep(sleep * (2 ** i))
     return html
 
-async def scrape_game(standings_file):
-    with open(standings_file, 'r') as f:
-        html = f.read()
-
-    soup = BeautifulSoup(html)
-    links = soup.find_all("a")
-    hrefs = [l.get('href') for l in links]
-    box_scores = [l for l in hrefs if l and "boxscore" in l and '.html' in l]
-    box_scores = [f"https://www.basketball-reference.com{l}" for l in hrefs if l and "boxscore" in l and '.html' in l]
-    
+async def fetch_and_save(pool, client, sem, url, save_path, existing):
+    async with sem:
+        html = await get_html(pool, client, url, "#content")
+    if not html:
+        return
+    # Async write so a slow disk doesn't stall in-flight page loads;
+    # write to a temp file and rename so readers never see partial files
+    tmp_path = save_path + ".tmp"
+    async with aiofiles.open(tmp_path, "wb") as f:
+        await f.write(ZSTD_COMPRESSOR.compress(html.encode('utf-8')))
+    os.rename(tmp_path, save_path)
+    existing.add(os.path.basename(save_path))
+
+def flush_scores_dir():
+    # Durability is batched: individual saves skip fsync entirely and one
+    # directory flush at the end of the run covers all new entries
+    if hasattr(os, 'O_DIRECTORY'):
+        fd = os.open(SCORES_DIR, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+def read_score(save_path):
+    # Helper for downstream readers of the compressed box scores
+    with open(save_path, 'rb') as f:
+        return zstd.ZstdDecompressor().decompress(f.read()).decode('utf-8')
+
+async def scrape_game(pool, client, sem, standings_file, existing):
+    # Reuse the cached link list if the standings file hasn't changed
+    cache_path = standings_file + ".urls.json"
+    box_scores = None
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(standings_file):
+        with open(cache_path, 'r') as f:
+            box_scores = json.load(f)
+
+    if box_scores is None:
+        async with aiofiles.open(standings_file, 'rb') as f:
+            html = await f.read()
+
+        hrefs = BOX_RE.findall(html)
+        box_scores = [f"https://www.basketball-reference.com{h.decode()}" for h in hrefs]
+
+        with open(cache_path, 'w') as f:
+            json.dump(box_scores, f)
+
+    # Fetch box scores concurrently, bounded by the shared semaphore
+    tasks = []
     for url in box_scores:
-        save_path = os.path.join(SCORES_DIR, url.split("/")[-1])
-        if os.path.exists(save_path):
+        fname = url.split("/")[-1]
+        # Uncompressed files from older runs still count as done
+        if fname in existing or fname + ".zst" in existing:
             continue
+        save_path = os.path.join(SCORES_DIR, fname + ".zst")
+        tasks.append(fetch_and_save(pool, client, sem, url, save_path, existing))
 
-        html = await get_html(url, "#content")
-        if not html:
-            continue
-        with open(save_path, "w+", encoding='utf-8') as f:
-            f.write(html)
+    await asyncio.gather(*tasks, return_exceptions=True)
 
 async def main():
-    standings_files = os.listdir(STANDINGS_DIR)
-    for f in standings_files:
-        filepath = os.path.join(STANDINGS_DIR, f)
-        await scrape_game(filepath)
+    async with async_playwright() as p:
+        # Launch the browser once and reuse it for every URL
+        browser = await p.firefox.launch(headless=True)
+        pool = await make_context_pool(browser)
+
+        # One directory listing instead of a stat call per URL; leftover
+        # .tmp files from an interrupted run don't count as done
+        existing = {f for f in os.listdir(SCORES_DIR) if not f.endswith(".tmp")}
+
+        # Shared HTTP client with connection pooling for the fast path
+        async with httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=10),
+            follow_redirects=True,
+        ) as client:
+            # Work all standings files at once; the single semaphore keeps
+            # total fetch concurrency bounded across the whole run
+            sem = asyncio.Semaphore(POOL_SIZE)
+            tasks = [
+                scrape_game(pool, client, sem, os.path.join(STANDINGS_DIR, f), existing)
+                for f in os.listdir(STANDINGS_DIR)
+                if not f.endswith(".urls.json")
+            ]
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Persist session state for the next run
+        context = await pool.get()
+        await context.storage_state(path=STATE_PATH)
+
+        await browser.close()
+        flush_scores_dir()
 
 # Run the main function
 asyncio.run(main())
\ No newline at end of file
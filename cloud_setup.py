@@ -24,18 +24,20 @@ class CloudOptimizer:
     def detect_cloud_environment(self):
         """Detect if running in cloud environment"""
         cloud_indicators = {
-            'aws': ['AWS_', 'EC2_'],
-            'gcp': ['GOOGLE_CLOUD_', 'GCP_'],
-            'azure': ['AZURE_', 'MSFT_'],
-            'digitalocean': ['DIGITALOCEAN_', 'DO_']
+            'aws': ('AWS_', 'EC2_'),
+            'gcp': ('GOOGLE_CLOUD_', 'GCP_'),
+            'azure': ('AZURE_', 'MSFT_'),
+            'digitalocean': ('DIGITALOCEAN_', 'DO_')
         }
-        
+
+        # Snapshot once; str.startswith takes a prefix tuple, so each cloud
+        # needs a single pass instead of one scan per prefix
+        env_names = tuple(os.environ)
         for cloud, prefixes in cloud_indicators.items():
-            for prefix in prefixes:
-                if any(env.startswith(prefix) for env in os.environ.keys()):
-                    logger.info(f"Detected {cloud.upper()} environment")
-                    return cloud
-        
+            if any(env.startswith(prefixes) for env in env_names):
+                logger.info(f"Detected {cloud.upper()} environment")
+                return cloud
+
         return 'local'
     
     def optimize_for_cloud(self, cloud_type):
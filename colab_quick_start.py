@@ -29,13 +29,14 @@ def setup_colab():
         'psutil==5.9.6'
     ]
     
-    for dep in dependencies:
-        try:
-            subprocess.run([sys.executable, '-m', 'pip', 'install', dep], 
-                         check=True, capture_output=True)
-            print(f"✅ Installed {dep}")
-        except subprocess.CalledProcessError as e:
-            print(f"⚠️  Warning: Could not install {dep}: {e}")
+    # One pip invocation resolves everything together and skips the
+    # per-package startup cost
+    try:
+        subprocess.run([sys.executable, '-m', 'pip', 'install', *dependencies],
+                     check=True, capture_output=True)
+        print(f"✅ Installed {len(dependencies)} packages")
+    except subprocess.CalledProcessError as e:
+        print(f"⚠️  Warning: Could not install dependencies: {e}")
     
     # Step 2: Install Playwright browser
     print("\n🌐 Installing Playwright browser...")
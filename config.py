@@ -1,36 +1,57 @@
 import os
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import List, Optional
-from pydantic import BaseSettings
+from dotenv import load_dotenv
 
-class Settings(BaseSettings):
+# Same .env support BaseSettings gave us
+load_dotenv()
+
+@dataclass
+class Settings:
     # Database settings
     DATABASE_URL: str = "sqlite:///basketball_data.db"
-    
+
     # Scraping settings
     BASE_URL: str = "https://www.basketball-reference.com"
     REQUEST_DELAY: float = 1.0
     MAX_RETRIES: int = 3
     TIMEOUT: int = 30
-    
+    MAX_CONCURRENCY: int = 4
+
     # File paths
     DATA_DIR: Path = Path("data")
     SCORES_DIR: Path = Path("SCORES_DIR")
     LOGS_DIR: Path = Path("logs")
-    
+
     # Seasons to scrape
     START_SEASON: int = 2009
     END_SEASON: int = 2025
-    
+
     # Browser settings
     HEADLESS: bool = True
     USER_AGENT: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    
-    class Config:
-        env_file = ".env"
+
+    def __post_init__(self):
+        # Environment variables override the defaults, like BaseSettings did
+        for f in fields(self):
+            raw = os.getenv(f.name)
+            if raw is None:
+                continue
+            default = getattr(self, f.name)
+            if isinstance(default, bool):
+                setattr(self, f.name, raw.lower() in ("1", "true", "yes"))
+            else:
+                setattr(self, f.name, type(default)(raw))
 
 settings = Settings()
 
-# Create directories if they don't exist
-for directory in [settings.DATA_DIR, settings.SCORES_DIR, settings.LOGS_DIR]:
-    directory.mkdir(exist_ok=True) 
\ No newline at end of file
+_directories_created = False
+
+def ensure_directories():
+    """Create the data directories once, on first use rather than on import"""
+    global _directories_created
+    if _directories_created:
+        return
+    for directory in [settings.DATA_DIR, settings.SCORES_DIR, settings.LOGS_DIR]:
+        directory.mkdir(exist_ok=True)
+    _directories_created = True
@@ -1,125 +1,334 @@
 import os
+import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 from loguru import logger
 from typing import List, Dict, Optional
 from datetime import datetime
 import re
+from io import BytesIO
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from queue import Queue
+from threading import Thread
 
-from config import settings
+from sqlalchemy import select
+
+from config import settings, ensure_directories
 from models import Game, TeamGameStats, GameOfficial, PlayerGameStats, SessionLocal, create_tables
 
+# Column layouts of the basic and advanced box-score tables, hoisted so
+# parsing doesn't rebuild a mapping dict per table per game
+BASIC_COLS = ('mp', 'fg', 'fga', 'fg_pct', 'fg3', 'fg3a', 'fg3_pct', 'ft',
+              'fta', 'ft_pct', 'orb', 'drb', 'trb', 'ast', 'stl', 'blk',
+              'tov', 'pf', 'pts')
+ADVANCED_COLS = ('ts_pct', 'efg_pct', 'fg3a_rate', 'fta_rate', 'orb_pct',
+                 'drb_pct', 'trb_pct', 'ast_pct', 'stl_pct', 'blk_pct',
+                 'tov_pct', 'usg_pct', 'off_rtg', 'def_rtg', 'bpm')
+BASIC_MAX_COLS = tuple(f'{c}_max' for c in BASIC_COLS)
+BASIC_IS_PCT = frozenset(c for c in BASIC_COLS if 'pct' in c)
+
+# Most cells are tiny counting stats or one of a few percentage strings,
+# so look common atoms up before paying for an int()/float() parse
+_INT_CACHE = {str(i): i for i in range(200)}
+_FLOAT_CACHE = {'': 0.0, '0': 0.0, '1': 1.0, '.500': 0.5, '1.000': 1.0, '.000': 0.0}
+
+def _safe_int_str(text: str) -> int:
+    """Convert cell text to int, treating junk as 0"""
+    value = _INT_CACHE.get(text)
+    if value is not None:
+        return value
+    try:
+        return int(text) if text else 0
+    except (ValueError, TypeError):
+        return 0
+
+def _safe_float_str(text: str) -> float:
+    """Convert cell text to float, treating junk as 0.0"""
+    value = _FLOAT_CACHE.get(text)
+    if value is not None:
+        return value
+    try:
+        return float(text) if text else 0.0
+    except (ValueError, TypeError):
+        return 0.0
+
+# Column positions for the max aggregation, split by converter
+_PCT_IDX = tuple(i for i, c in enumerate(BASIC_COLS) if c in BASIC_IS_PCT)
+_INT_IDX = tuple(i for i, c in enumerate(BASIC_COLS) if c not in BASIC_IS_PCT)
+
+def _column_maxes(cells, idx, converter, dtype):
+    """Per-column maxima of the selected columns, converted in one pass
+
+    np.fromiter fills a preallocated typed buffer directly, skipping the
+    per-element boxing that np.vectorize would pay, and the reduction
+    itself runs on a fixed-dtype array.
+    """
+    cols = cells[:, idx]
+    flat = np.fromiter((converter(s) for s in cols.ravel()),
+                       dtype=dtype, count=cols.size)
+    return flat.reshape(cols.shape).max(axis=0)
+
+# Compiled once: the officials' names are anchors inside or right after
+# the div whose own text carries the "Officials:" label
+_OFFICIALS_XPATH = etree.XPath(
+    '//div[text()[contains(., "Officials:")]]/a[position()<=3]'
+    ' | //div[text()[contains(., "Officials:")]]/following-sibling::a[position()<=3]'
+)
+
+# Table rows minus the decorative over_header/thead rows, filtered in the
+# predicate rather than dropped from the tree in a mutation pre-pass
+_DATA_ROWS_XPATH = etree.XPath(
+    './/tr[not(contains(@class, "over_header")) and not(contains(@class, "thead"))]'
+)
+
+# Shared parser, built once per process: comments and processing
+# instructions are dropped at parse time so XPath never steps over them,
+# and huge_tree lifts libxml2's size limits for the bigger game pages
+_HTML_PARSER = lxml.html.HTMLParser(remove_comments=True, remove_pis=True,
+                                    recover=True, huge_tree=True)
+
+# Basketball-Reference wraps the advanced box tables in HTML comments;
+# unwrapping the markers before parsing turns them into real DOM
+_COMMENT_MARKERS_RE = re.compile(rb'<!--|-->')
+
+# Box-score filenames look like 202310240DEN.html; anything else would
+# blow up in the date slicing, so filter it out before parsing
+_GAME_ID_RE = re.compile(r'^\d{8}0[A-Z]{3}$')
+
+# Above this size (playoff pages with full play-by-play) building the
+# whole tree costs more than the handful of elements we read from it
+_STREAM_THRESHOLD = 2 * 1024 * 1024
+
+_WANTED_IDS = frozenset(
+    {'line_score'}
+    | {f'box-{team}-game-{kind}' for team in ('home', 'away') for kind in ('basic', 'advanced')}
+)
+
+def _stream_reduce(html: bytes):
+    """Stream-parse an oversized page down to a minimal tree
+
+    iterparse visits table/div end events and discards each element once
+    inspected, so memory stays bounded by the wanted elements rather
+    than the document. The kept elements are re-parsed into a small
+    lxml.html tree so the normal helpers work on it unchanged.
+    """
+    kept = []
+    found_tables = 0
+    officials_found = False
+    officials_parent = None
+    for _, element in etree.iterparse(BytesIO(html), events=('end',),
+                                      html=True, tag=('table', 'div')):
+        if element.tag == 'table':
+            if element.get('id') in _WANTED_IDS:
+                kept.append(etree.tostring(element))
+                found_tables += 1
+        elif not officials_found:
+            if element is officials_parent:
+                # The parent has closed, so the label div and its
+                # following-sibling referee anchors are all in the tree;
+                # serialize them together
+                kept.append(etree.tostring(element))
+                officials_found = True
+            elif element.text and 'Officials:' in element.text:
+                # The referee anchors are *following siblings* of this
+                # div, not parsed yet at its end event, so keep the div
+                # alive (skip the clear) and wait for its parent
+                officials_parent = element.getparent()
+                if officials_parent is None:
+                    kept.append(etree.tostring(element))
+                    officials_found = True
+                else:
+                    continue
+        element.clear()
+        if found_tables == len(_WANTED_IDS) and officials_found:
+            break
+    return lxml.html.fromstring(b'<div>' + b''.join(kept) + b'</div>', parser=_HTML_PARSER)
+
+def _row_cells(row) -> List[str]:
+    """Extract stripped text of every td/th cell in a row"""
+    return [cell.text_content().strip() for cell in row.iter('td', 'th')]
+
+# One DataProcessor per worker process, created lazily
+_worker_processor = None
+
+def _parse_worker(path: Path) -> Optional[Dict]:
+    """Module-level parse entry point so ProcessPoolExecutor can pickle it"""
+    global _worker_processor
+    if _worker_processor is None:
+        _worker_processor = DataProcessor()
+    return _worker_processor.parse_html_file(path)
+
 class DataProcessor:
     def __init__(self):
         self.scores_dir = settings.SCORES_DIR
-        
+
     def process_existing_files(self):
         """Process all existing HTML files and migrate to database"""
         logger.info("Starting to process existing HTML files")
-        
-        html_files = list(self.scores_dir.glob("*.html"))
+
+        # Drop files whose names aren't valid game ids up front, so the
+        # parse path never raises (and pays for) a malformed-date exception
+        html_files = [f for f in self.scores_dir.glob("*.html") if _GAME_ID_RE.match(f.stem)]
         logger.info(f"Found {len(html_files)} HTML files to process")
-        
+
+        # Skip already-ingested games before paying any parse cost:
+        # one SELECT of ids replaces a round-trip per file
+        db = SessionLocal()
+        try:
+            already_ingested = set(db.execute(select(Game.game_id)).scalars())
+        finally:
+            db.close()
+
+        if already_ingested:
+            html_files = [f for f in html_files if f.stem not in already_ingested]
+            logger.info(f"{len(html_files)} files not yet in the database")
+
         processed_count = 0
         error_count = 0
-        
-        for html_file in html_files:
+
+        # Bounded hand-off between the parser pool and a single writer
+        # thread: parsing keeps going while a batch commits, and maxsize
+        # keeps memory flat if the database falls behind
+        queue = Queue(maxsize=64)
+
+        def write_batches():
+            batch = []
+            # One session for the writer's whole lifetime instead of a
+            # connection acquire and transaction begin per batch
+            db = SessionLocal()
             try:
-                game_data = self.parse_html_file(html_file)
-                if game_data:
-                    self.save_game_to_database(game_data)
-                    processed_count += 1
-                    
-                    if processed_count % 100 == 0:
-                        logger.info(f"Processed {processed_count}/{len(html_files)} files")
-                        
+                while True:
+                    game_data = queue.get()
+                    if game_data is None:
+                        break
+                    batch.append(game_data)
+                    if len(batch) >= 500:
+                        self.save_games_batch(db, batch)
+                        batch = []
+                if batch:
+                    self.save_games_batch(db, batch)
             except Exception as e:
-                logger.error(f"Error processing {html_file}: {e}")
-                error_count += 1
-        
+                # Keep consuming until the sentinel so the producer never
+                # blocks on a full queue once the writer is dead
+                logger.error(f"Writer thread failed: {e}")
+                dropped = 0
+                while queue.get() is not None:
+                    dropped += 1
+                logger.error(f"Writer dropped {dropped} parsed games after the failure")
+            finally:
+                db.close()
+
+        writer = Thread(target=write_batches)
+        writer.start()
+
+        # Parsing is CPU-bound and per-file independent, so fan it out
+        # across cores; database writes stay on the writer thread
+        try:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                for game_data in executor.map(_parse_worker, html_files, chunksize=32):
+                    if game_data:
+                        queue.put(game_data)
+                        processed_count += 1
+
+                        if processed_count % 100 == 0:
+                            logger.info(f"Processed {processed_count}/{len(html_files)} files")
+                    else:
+                        error_count += 1
+        finally:
+            # Always send the sentinel — it flushes the writer's final
+            # partial batch, and without it a pool failure above would
+            # leave the writer blocked on queue.get() forever
+            queue.put(None)
+            writer.join()
+
         logger.info(f"Processing complete. Processed: {processed_count}, Errors: {error_count}")
-    
+
     def parse_html_file(self, file_path: Path) -> Optional[Dict]:
         """Parse a single HTML file and extract game data"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                html = f.read()
-            
-            soup = BeautifulSoup(html, 'lxml')
-            
-            # Remove problematic elements
-            for selector in ["tr.over_header", "tr.thead"]:
-                for element in soup.select(selector):
-                    element.decompose()
-            
+            # Feed raw bytes to the parser: libxml2 decodes in C, so there
+            # is no Python-level str copy of a multi-MB page
+            html = file_path.read_bytes()
+
+            html = _COMMENT_MARKERS_RE.sub(b'', html)
+            if len(html) > _STREAM_THRESHOLD:
+                tree = _stream_reduce(html)
+            else:
+                tree = lxml.html.fromstring(html, parser=_HTML_PARSER)
+
             # Parse game data
-            game_data = self._parse_basic_game_info(soup, file_path)
+            game_data = self._parse_basic_game_info(tree, file_path)
             if not game_data:
                 return None
-            
+
+            # Resolve each box-score table once instead of per helper call
+            tables = {
+                (team, kind): tree.get_element_by_id(f'box-{team}-game-{kind}', None)
+                for team in ('home', 'away')
+                for kind in ('basic', 'advanced')
+            }
+
             # Parse team stats
-            team_stats = self._parse_team_stats(soup, game_data['game_id'])
+            team_stats = self._parse_team_stats(tables, game_data['game_id'])
             game_data['team_stats'] = team_stats
-            
+
             # Parse player stats
-            player_stats = self._parse_player_stats(soup, game_data['game_id'])
+            player_stats = self._parse_player_stats(tables, game_data['game_id'])
             game_data['player_stats'] = player_stats
-            
+
             # Parse officials
-            officials = self._parse_officials(soup, game_data['game_id'])
+            officials = self._parse_officials(tree, game_data['game_id'])
             game_data['officials'] = officials
-            
+
             return game_data
-            
+
         except Exception as e:
             logger.error(f"Error parsing {file_path}: {e}")
             return None
-    
-    def _parse_basic_game_info(self, soup: BeautifulSoup, file_path: Path) -> Optional[Dict]:
+
+    def _parse_basic_game_info(self, tree, file_path: Path) -> Optional[Dict]:
         """Parse basic game information from HTML"""
         try:
             # Extract game ID from filename
             game_id = file_path.stem
-            
-            # Parse date from filename
-            date_str = game_id[:8]  # YYYYMMDD format
-            game_date = datetime.strptime(date_str, "%Y%m%d")
-            
-            # Get season
-            season = game_date.year
-            if game_date.month < 7:  # NBA season spans two calendar years
-                season -= 1
-            
+
+            # Parse date from filename (fixed YYYYMMDD prefix); slicing the
+            # digits directly skips strptime's format/locale machinery
+            y, m, d = int(game_id[0:4]), int(game_id[4:6]), int(game_id[6:8])
+            game_date = datetime(y, m, d)
+
+            # NBA season spans two calendar years
+            season = y - 1 if m < 7 else y
+
             # Parse line score
-            line_score_table = soup.find('table', {'id': 'line_score'})
-            if not line_score_table:
+            line_score_table = tree.get_element_by_id('line_score', None)
+            if line_score_table is None:
                 return None
-            
+
             # Extract team names and scores
-            rows = line_score_table.find_all('tr')[1:]  # Skip header
+            rows = _DATA_ROWS_XPATH(line_score_table)[1:]  # Skip header
             if len(rows) < 2:
                 return None
-            
+
             teams = []
             scores = []
-            
+
             for row in rows:
-                cells = row.find_all(['td', 'th'])
+                cells = _row_cells(row)
                 if len(cells) >= 2:
-                    team = cells[0].get_text(strip=True)
-                    total_score = int(cells[-1].get_text(strip=True))
-                    teams.append(team)
-                    scores.append(total_score)
-            
+                    teams.append(cells[0])
+                    scores.append(int(cells[-1]))
+
             if len(teams) != 2 or len(scores) != 2:
                 return None
-            
+
             # Determine home/away (usually second team is home)
             away_team, home_team = teams
             away_score, home_score = scores
             home_won = home_score > away_score
-            
+
             return {
                 'game_id': game_id,
                 'date': game_date,
@@ -130,28 +339,27 @@ class DataProcessor:
                 'away_score': away_score,
                 'home_won': home_won
             }
-            
+
         except Exception as e:
             logger.error(f"Error parsing basic game info: {e}")
             return None
-    
-    def _parse_team_stats(self, soup: BeautifulSoup, game_id: str) -> List[Dict]:
+
+    def _parse_team_stats(self, tables: Dict, game_id: str) -> List[Dict]:
         """Parse team statistics"""
         team_stats = []
-        
+
         try:
-            # Find team stat tables
             for team in ['home', 'away']:
-                basic_table = soup.find('table', {'id': f'box-{team}-game-basic'})
-                advanced_table = soup.find('table', {'id': f'box-{team}-game-advanced'})
-                
-                if not basic_table:
+                basic_table = tables[(team, 'basic')]
+                advanced_table = tables[(team, 'advanced')]
+
+                if basic_table is None:
                     continue
-                
+
                 # Parse basic stats
                 basic_stats = self._parse_stats_table(basic_table, 'basic')
-                advanced_stats = self._parse_stats_table(advanced_table, 'advanced') if advanced_table else {}
-                
+                advanced_stats = self._parse_stats_table(advanced_table, 'advanced') if advanced_table is not None else {}
+
                 # Combine stats
                 team_stat = {
                     'game_id': game_id,
@@ -160,56 +368,73 @@ class DataProcessor:
                     **basic_stats,
                     **advanced_stats
                 }
-                
+
                 team_stats.append(team_stat)
-                
+
         except Exception as e:
             logger.error(f"Error parsing team stats: {e}")
-        
+
         return team_stats
-    
-    def _parse_player_stats(self, soup: BeautifulSoup, game_id: str) -> List[Dict]:
+
+    def _parse_player_stats(self, tables: Dict, game_id: str) -> List[Dict]:
         """Parse individual player statistics"""
         player_stats = []
-        
+
         try:
             for team in ['home', 'away']:
-                basic_table = soup.find('table', {'id': f'box-{team}-game-basic'})
-                advanced_table = soup.find('table', {'id': f'box-{team}-game-advanced'})
-                
-                if not basic_table:
+                basic_table = tables[(team, 'basic')]
+
+                if basic_table is None:
                     continue
-                
+
+                # Index the advanced rows by player once per team so each
+                # player row is an O(1) lookup instead of a table scan
+                advanced_rows = self._index_advanced_rows(tables[(team, 'advanced')])
+
                 # Parse player rows (skip totals row)
-                rows = basic_table.find_all('tr')[1:-1]  # Skip header and totals
-                
+                rows = _DATA_ROWS_XPATH(basic_table)[1:-1]  # Skip header and totals
+
                 for row in rows:
-                    player_stat = self._parse_player_row(row, game_id, team)
+                    player_stat = self._parse_player_row(row, game_id, team, advanced_rows)
                     if player_stat:
                         player_stats.append(player_stat)
-                        
+
         except Exception as e:
             logger.error(f"Error parsing player stats: {e}")
-        
+
         return player_stats
-    
-    def _parse_player_row(self, row, game_id: str, team: str) -> Optional[Dict]:
+
+    def _index_advanced_rows(self, table) -> Dict[str, List[str]]:
+        """Map player name to their advanced-table cell strings"""
+        index = {}
+        if table is None:
+            return index
+
+        for row in _DATA_ROWS_XPATH(table):
+            cells = _row_cells(row)
+            if cells:
+                index.setdefault(cells[0], cells)
+
+        return index
+
+    def _parse_player_row(self, row, game_id: str, team: str,
+                          advanced_rows: Dict[str, List[str]]) -> Optional[Dict]:
         """Parse a single player row"""
         try:
-            cells = row.find_all(['td', 'th'])
+            cells = _row_cells(row)
             if len(cells) < 10:  # Need minimum columns
                 return None
-            
-            player_name = cells[0].get_text(strip=True)
+
+            player_name = cells[0]
             if not player_name or player_name == 'Reserves' or player_name == 'Team Totals':
                 return None
-            
+
             # Extract basic stats
             stats = {
                 'game_id': game_id,
                 'team': team,
                 'player_name': player_name,
-                'mp': cells[1].get_text(strip=True) if len(cells) > 1 else '0',
+                'mp': cells[1] if len(cells) > 1 else '0',
                 'fg': self._safe_int(cells[2]) if len(cells) > 2 else 0,
                 'fga': self._safe_int(cells[3]) if len(cells) > 3 else 0,
                 'fg_pct': self._safe_float(cells[4]) if len(cells) > 4 else 0.0,
@@ -230,205 +455,192 @@ class DataProcessor:
                 'pts': self._safe_int(cells[19]) if len(cells) > 19 else 0,
                 'plus_minus': self._safe_int(cells[20]) if len(cells) > 20 else 0,
             }
-            
+
             # Add advanced stats if available
-            if advanced_table := soup.find('table', {'id': f'box-{team}-game-advanced'}):
-                advanced_stats = self._parse_player_advanced_stats(advanced_table, player_name)
-                stats.update(advanced_stats)
-            
+            advanced_cells = advanced_rows.get(player_name)
+            if advanced_cells:
+                for stat_name, value in zip(ADVANCED_COLS, advanced_cells[1:]):
+                    stats[stat_name] = self._safe_float(value)
+
             return stats
-            
+
         except Exception as e:
             logger.error(f"Error parsing player row: {e}")
             return None
-    
-    def _parse_player_advanced_stats(self, table, player_name: str) -> Dict:
-        """Parse advanced stats for a specific player"""
-        stats = {}
-        
-        try:
-            rows = table.find_all('tr')
-            for row in rows:
-                cells = row.find_all(['td', 'th'])
-                if len(cells) > 0 and cells[0].get_text(strip=True) == player_name:
-                    # Advanced stats mapping
-                    stat_mapping = {
-                        1: 'ts_pct', 2: 'efg_pct', 3: 'fg3a_rate', 4: 'fta_rate',
-                        5: 'orb_pct', 6: 'drb_pct', 7: 'trb_pct', 8: 'ast_pct',
-                        9: 'stl_pct', 10: 'blk_pct', 11: 'tov_pct', 12: 'usg_pct',
-                        13: 'off_rtg', 14: 'def_rtg', 15: 'bpm'
-                    }
-                    
-                    for i, cell in enumerate(cells[1:], 1):
-                        if i in stat_mapping:
-                            stat_name = stat_mapping[i]
-                            value = cell.get_text(strip=True)
-                            stats[stat_name] = self._safe_float(value)
-                    break
-                    
-        except Exception as e:
-            logger.error(f"Error parsing advanced stats for {player_name}: {e}")
-        
-        return stats
-    
+
     def _parse_stats_table(self, table, stat_type: str) -> Dict:
         """Parse a statistics table (basic or advanced)"""
         stats = {}
-        
+
         try:
-            if not table:
+            if table is None:
                 return stats
-            
+
             # Find totals row (usually last row)
-            rows = table.find_all('tr')
+            rows = _DATA_ROWS_XPATH(table)
             if not rows:
                 return stats
-            
+
             totals_row = rows[-1]  # Last row is usually totals
-            cells = totals_row.find_all(['td', 'th'])
-            
+            cells = _row_cells(totals_row)
+
             if stat_type == 'basic':
-                # Basic stats mapping
-                stat_mapping = {
-                    1: 'mp', 2: 'fg', 3: 'fga', 4: 'fg_pct', 5: 'fg3', 6: 'fg3a', 
-                    7: 'fg3_pct', 8: 'ft', 9: 'fta', 10: 'ft_pct', 11: 'orb', 
-                    12: 'drb', 13: 'trb', 14: 'ast', 15: 'stl', 16: 'blk', 
-                    17: 'tov', 18: 'pf', 19: 'pts'
-                }
-            else:  # advanced
-                # Advanced stats mapping
-                stat_mapping = {
-                    1: 'ts_pct', 2: 'efg_pct', 3: 'fg3a_rate', 4: 'fta_rate',
-                    5: 'orb_pct', 6: 'drb_pct', 7: 'trb_pct', 8: 'ast_pct',
-                    9: 'stl_pct', 10: 'blk_pct', 11: 'tov_pct', 12: 'usg_pct',
-                    13: 'off_rtg', 14: 'def_rtg', 15: 'bpm'
-                }
-            
-            for i, cell in enumerate(cells[1:], 1):  # Skip first column (team name)
-                if i in stat_mapping:
-                    stat_name = stat_mapping[i]
-                    value = cell.get_text(strip=True)
-                    
-                    if stat_type == 'basic':
-                        if 'pct' in stat_name:
-                            stats[stat_name] = self._safe_float(value)
-                        else:
-                            stats[stat_name] = self._safe_int(value)
-                    else:  # advanced
+                # Skip first column (team name)
+                for stat_name, value in zip(BASIC_COLS, cells[1:]):
+                    if stat_name in BASIC_IS_PCT:
                         stats[stat_name] = self._safe_float(value)
-            
-            # Add max stats for basic stats
-            if stat_type == 'basic':
-                for i, row in enumerate(rows[1:-1]):  # Skip header and totals
-                    cells = row.find_all(['td', 'th'])
-                    for j, cell in enumerate(cells[1:], 1):
-                        if j in stat_mapping:
-                            stat_name = stat_mapping[j] + '_max'
-                            value = cell.get_text(strip=True)
-                            
-                            if 'pct' in stat_mapping[j]:
-                                current_max = stats.get(stat_name, 0.0)
-                                new_value = self._safe_float(value)
-                                stats[stat_name] = max(current_max, new_value)
-                            else:
-                                current_max = stats.get(stat_name, 0)
-                                new_value = self._safe_int(value)
-                                stats[stat_name] = max(current_max, new_value)
-                                
+                    else:
+                        stats[stat_name] = self._safe_int(value)
+
+                # Add max stats over the player rows: one C-level column
+                # reduction instead of a Python max() call per cell
+                player_cells = [c for c in (_row_cells(r) for r in rows[1:-1])
+                                if len(c) > len(BASIC_COLS)]  # Skip header, totals, DNPs
+                if player_cells:
+                    arr = np.array([c[1:len(BASIC_COLS) + 1] for c in player_cells],
+                                   dtype=object)
+                    for idx, value in zip(_INT_IDX, _column_maxes(arr, _INT_IDX, _safe_int_str, np.int64)):
+                        stats[BASIC_MAX_COLS[idx]] = int(value)
+                    for idx, value in zip(_PCT_IDX, _column_maxes(arr, _PCT_IDX, _safe_float_str, np.float64)):
+                        stats[BASIC_MAX_COLS[idx]] = float(value)
+            else:  # advanced
+                for stat_name, value in zip(ADVANCED_COLS, cells[1:]):
+                    stats[stat_name] = self._safe_float(value)
+
         except Exception as e:
             logger.error(f"Error parsing {stat_type} stats table: {e}")
-        
+
         return stats
-    
-    def _parse_officials(self, soup: BeautifulSoup, game_id: str) -> List[Dict]:
+
+    def _parse_officials(self, tree, game_id: str) -> List[Dict]:
         """Parse game officials"""
         officials = []
-        
+
         try:
-            # Look for officials section
-            officials_div = soup.find('div', string=lambda text: 'Officials:' in str(text) if text else False)
-            
-            if officials_div:
-                official_links = officials_div.find_next_siblings('a')
-                for i, official in enumerate(official_links[:3], 1):  # Max 3 officials
-                    official_data = {
-                        'game_id': game_id,
-                        'official_name': official.get_text(strip=True),
-                        'official_url': official.get('href', ''),
-                        'position': i
-                    }
-                    officials.append(official_data)
-                    
+            # The containment test runs inside libxml2 instead of a Python
+            # check against every div in the document
+            for i, official in enumerate(_OFFICIALS_XPATH(tree)[:3], 1):
+                official_data = {
+                    'game_id': game_id,
+                    'official_name': official.text_content().strip(),
+                    'official_url': official.get('href', ''),
+                    'position': i
+                }
+                officials.append(official_data)
+
         except Exception as e:
             logger.error(f"Error parsing officials: {e}")
-        
+
         return officials
-    
-    def _safe_int(self, cell) -> int:
+
+    def _safe_int(self, text: str) -> int:
         """Safely convert cell text to integer"""
-        try:
-            text = cell.get_text(strip=True)
-            return int(text) if text and text != '' else 0
-        except (ValueError, AttributeError):
-            return 0
-    
-    def _safe_float(self, cell) -> float:
+        return _safe_int_str(text)
+
+    def _safe_float(self, text: str) -> float:
         """Safely convert cell text to float"""
+        return _safe_float_str(text)
+
+    def save_games_batch(self, db, games: List[Dict], batch_size: int = 1000):
+        """Bulk-insert a batch of parsed games with a handful of statements
+
+        The session is owned by the caller and stays open across batches.
+        """
+        if not games:
+            return
+
         try:
-            text = cell.get_text(strip=True)
-            return float(text) if text and text != '' else 0.0
-        except (ValueError, AttributeError):
-            return 0.0
-    
-    def save_game_to_database(self, game_data: Dict):
-        """Save processed game data to database"""
-        db = SessionLocal()
+            for start in range(0, len(games), batch_size):
+                chunk = games[start:start + batch_size]
+
+                # One round-trip existence check for the whole chunk
+                ids = [g['game_id'] for g in chunk]
+                existing = set(db.execute(select(Game.game_id).where(Game.game_id.in_(ids))).scalars())
+                new_games = [g for g in chunk if g['game_id'] not in existing]
+                if not new_games:
+                    continue
+
+                game_rows = [
+                    {k: v for k, v in g.items()
+                     if k not in ('team_stats', 'player_stats', 'officials')}
+                    for g in new_games
+                ]
+                team_rows = [row for g in new_games for row in g.get('team_stats', [])]
+                player_rows = [row for g in new_games for row in g.get('player_stats', [])]
+                official_rows = [row for g in new_games for row in g.get('officials', [])]
+
+                db.bulk_insert_mappings(Game, game_rows)
+                if team_rows:
+                    db.bulk_insert_mappings(TeamGameStats, team_rows)
+                if player_rows:
+                    db.bulk_insert_mappings(PlayerGameStats, player_rows)
+                if official_rows:
+                    db.bulk_insert_mappings(GameOfficial, official_rows)
+                db.commit()
+                # Release flushed ORM state so the long-lived session
+                # doesn't accumulate it across batches
+                db.expire_all()
+
+                logger.debug(f"Saved batch of {len(new_games)} games to database")
+
+        except Exception as e:
+            logger.error(f"Error saving games batch: {e}")
+            db.rollback()
+
+    def save_game_to_database(self, db, game_data: Dict):
+        """Save processed game data to a caller-owned session
+
+        Sharing one session across games amortizes the connection
+        checkout and transaction begin that a per-game session pays.
+        """
         try:
-            # Check if game already exists
-            existing_game = db.query(Game).filter(Game.game_id == game_data['game_id']).first()
+            # Check if game already exists; selecting just the id skips
+            # building an instrumented ORM object for the test
+            existing_game = db.execute(
+                select(Game.game_id).where(Game.game_id == game_data['game_id'])
+            ).scalar()
             if existing_game:
                 logger.debug(f"Game {game_data['game_id']} already exists, skipping")
                 return
-            
+
             # Create game record
             game = Game(**game_data)
             db.add(game)
             db.commit()
-            
+
             # Add team stats
             for team_stat in game_data.get('team_stats', []):
                 team_game_stat = TeamGameStats(**team_stat)
                 db.add(team_game_stat)
-            
+
             # Add player stats
             for player_stat in game_data.get('player_stats', []):
                 player_game_stat = PlayerGameStats(**player_stat)
                 db.add(player_game_stat)
-            
+
             # Add officials
             for official in game_data.get('officials', []):
                 game_official = GameOfficial(**official)
                 db.add(game_official)
-            
+
             db.commit()
             logger.debug(f"Saved game {game_data['game_id']} to database")
-            
+
         except Exception as e:
             logger.error(f"Error saving game {game_data.get('game_id', 'unknown')}: {e}")
             db.rollback()
-        finally:
-            db.close()
 
 def main():
     """Main function to process existing HTML files"""
     logger.add("logs/data_processor.log", rotation="1 day", retention="30 days")
-    
-    # Create database tables
+
+    # Create directories and database tables
+    ensure_directories()
     create_tables()
-    
+
     # Process existing files
     processor = DataProcessor()
     processor.process_existing_files()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -1,385 +1,427 @@
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker, joinedload
+from sqlalchemy import case, create_engine, func, lambda_stmt, select, text, union_all
+from sqlalchemy.orm import sessionmaker
 from typing import List, Dict, Optional, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 from datetime import datetime, date
 from loguru import logger
 
 from config import settings
-from models import Game, TeamGameStats, GameOfficial, PlayerGameStats, SessionLocal
+from models import Game, TeamGameStats, GameOfficial, PlayerGameStats, SessionLocal, configure_sqlite
+
+# Columns the stats DataFrames expose, in output order
+TEAM_STAT_COLS = ('fg', 'fga', 'fg_pct', 'fg3', 'fg3a', 'fg3_pct', 'ft',
+                  'fta', 'ft_pct', 'orb', 'drb', 'trb', 'ast', 'stl', 'blk',
+                  'tov', 'pf', 'pts', 'ts_pct', 'efg_pct', 'off_rtg', 'def_rtg')
+PLAYER_STAT_COLS = ('mp', 'fg', 'fga', 'fg_pct', 'fg3', 'fg3a', 'fg3_pct',
+                    'ft', 'fta', 'ft_pct', 'orb', 'drb', 'trb', 'ast', 'stl',
+                    'blk', 'tov', 'pf', 'pts', 'plus_minus', 'ts_pct',
+                    'efg_pct', 'bpm')
+
+# Season-aggregate layout: counting stats are summed, everything in the
+# averages block is mean-ed
+PLAYER_TOTAL_COLS = ('fg', 'fga', 'fg3', 'fg3a', 'ft', 'fta', 'orb', 'drb',
+                     'trb', 'ast', 'stl', 'blk', 'tov', 'pf', 'pts')
+PLAYER_AVG_COLS = ('fg', 'fga', 'fg_pct', 'fg3', 'fg3a', 'fg3_pct', 'ft',
+                   'fta', 'ft_pct', 'orb', 'drb', 'trb', 'ast', 'stl', 'blk',
+                   'tov', 'pf', 'pts', 'plus_minus', 'ts_pct', 'efg_pct', 'bpm')
+
+# How long cached getter results stay fresh; past seasons are immutable
+# so even dashboards polling these methods only pay the query once
+CACHE_TTL_SECONDS = 300
 
 class DatabaseManager:
     def __init__(self):
-        self.engine = create_engine(settings.DATABASE_URL)
+        # Explicit pool sizing: the default five connections plus ten
+        # overflow starve under concurrent callers, and pre-ping retires
+        # stale connections in long-running processes. SQLite keeps its
+        # own pooling; the sizing knobs only apply to server databases.
+        pool_kwargs = {}
+        if not settings.DATABASE_URL.startswith("sqlite"):
+            pool_kwargs = {"pool_size": 20, "max_overflow": 40, "pool_recycle": 1800}
+        self.engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True,
+                                    insertmanyvalues_page_size=10_000, **pool_kwargs)
+        configure_sqlite(self.engine)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
-    
+        self._cache = {}
+
+    def _cached(self, key, loader):
+        """Serve repeat idempotent reads from a TTL'd in-process cache"""
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and now - hit[0] < CACHE_TTL_SECONDS:
+            value = hit[1]
+        else:
+            value = loader()
+            self._cache[key] = (now, value)
+        # Hand DataFrames out as copies so callers can't mutate the cache
+        return value.copy() if isinstance(value, pd.DataFrame) else value
+
     def get_session(self):
         """Get a database session"""
         return self.SessionLocal()
-    
+
     def get_games_by_season(self, season: int) -> List[Game]:
         """Get all games for a specific season"""
+        def load():
+            session = self.get_session()
+            try:
+                # lambda_stmt caches the compiled SQL keyed on the lambda,
+                # so repeat calls only rebind the season parameter
+                stmt = lambda_stmt(lambda: select(Game).where(Game.season == season))
+                return session.execute(stmt).scalars().all()
+            finally:
+                session.close()
+
+        return self._cached(('games_by_season', season), load)
+    
+    def iter_games_by_season(self, season: int):
+        """Stream games for a season instead of materializing the list
+
+        yield_per with stream_results keeps at most 500 rows buffered
+        and yields the first game as soon as it arrives; callers that
+        need the whole list keep get_games_by_season.
+        """
+        session = self.get_session()
+        try:
+            result = session.execute(
+                select(Game).where(Game.season == season)
+                .execution_options(yield_per=500, stream_results=True)
+            )
+            yield from result.scalars()
+        finally:
+            session.close()
+
+    def iter_games_by_date_range(self, start_date: date, end_date: date):
+        """Stream games within a date range, like iter_games_by_season"""
         session = self.get_session()
         try:
-            games = session.query(Game).filter(Game.season == season).all()
-            return games
+            result = session.execute(
+                select(Game)
+                .where(Game.date >= start_date, Game.date <= end_date)
+                .execution_options(yield_per=500, stream_results=True)
+            )
+            yield from result.scalars()
         finally:
             session.close()
-    
+
     def get_games_by_date_range(self, start_date: date, end_date: date) -> List[Game]:
         """Get games within a date range"""
         session = self.get_session()
         try:
-            games = session.query(Game).filter(
+            stmt = lambda_stmt(lambda: select(Game).where(
                 Game.date >= start_date,
                 Game.date <= end_date
-            ).all()
-            return games
+            ))
+            return session.execute(stmt).scalars().all()
         finally:
             session.close()
-    
+
+    def get_games_frame_by_date_range(self, start_date: date,
+                                      end_date: date) -> pd.DataFrame:
+        """Games within a date range as a score-column DataFrame
+
+        For aggregate analysis over the scores: skips ORM hydration and
+        returns typed columns ready for vectorized reductions.
+        """
+        stmt = select(Game.game_id, Game.date, Game.home_team, Game.home_score,
+                      Game.away_team, Game.away_score).where(
+            Game.date >= start_date,
+            Game.date <= end_date
+        )
+        return pd.read_sql_query(stmt, self.engine)
+
     def get_games_by_team(self, team: str, season: Optional[int] = None) -> List[Game]:
         """Get all games for a specific team"""
         session = self.get_session()
         try:
-            query = session.query(Game).filter(
-                (Game.home_team == team) | (Game.away_team == team)
-            )
-            
+            # UNION ALL of two indexed seeks: the planner often can't
+            # drive the home_team and away_team indexes through an OR
+            # and falls back to scanning the table
+            home_q = select(Game).where(Game.home_team == team)
+            away_q = select(Game).where(Game.away_team == team)
             if season:
-                query = query.filter(Game.season == season)
-            
-            return query.all()
+                home_q = home_q.where(Game.season == season)
+                away_q = away_q.where(Game.season == season)
+
+            stmt = select(Game).from_statement(union_all(home_q, away_q))
+            return session.execute(stmt).scalars().all()
         finally:
             session.close()
     
-    def get_team_stats(self, team: str, season: Optional[int] = None) -> pd.DataFrame:
-        """Get team statistics as a DataFrame"""
+    def get_team_stats(self, team: str, season: Optional[int] = None,
+                       columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Get team statistics as a DataFrame
+
+        columns restricts which stat columns are selected; callers that
+        only reduce a handful of stats avoid pulling the rest off the
+        database and converting them.
+        """
+        stat_cols = columns if columns is not None else TEAM_STAT_COLS
+        stmt = (
+            select(TeamGameStats.game_id, Game.date, Game.season, TeamGameStats.is_home,
+                   *(getattr(TeamGameStats, c) for c in stat_cols))
+            .join(Game, TeamGameStats.game_id == Game.game_id)
+            .where(TeamGameStats.team == team)
+        )
+
+        if season:
+            stmt = stmt.where(Game.season == season)
+
+        # read_sql_query streams rows from the DBAPI cursor straight into
+        # typed columns, skipping ORM hydration and per-row dict builds
+        return pd.read_sql_query(stmt, self.engine)
+    
+    def _player_name_filter(self, player_name: str):
+        """Build the cheapest predicate that matches the given name
+
+        An exact name hits the player_name index; the leading-wildcard
+        LIKE, which forces a full scan, is kept only as the fallback for
+        partial names.
+        """
         session = self.get_session()
         try:
-            query = session.query(TeamGameStats).join(Game).filter(TeamGameStats.team == team)
-            
-            if season:
-                query = query.filter(Game.season == season)
-            
-            # Convert to DataFrame
-            results = query.all()
-            data = []
-            for stat in results:
-                data.append({
-                    'game_id': stat.game_id,
-                    'date': stat.home_game.date if stat.home_game else stat.away_game.date,
-                    'season': stat.home_game.season if stat.home_game else stat.away_game.season,
-                    'is_home': stat.is_home,
-                    'fg': stat.fg,
-                    'fga': stat.fga,
-                    'fg_pct': stat.fg_pct,
-                    'fg3': stat.fg3,
-                    'fg3a': stat.fg3a,
-                    'fg3_pct': stat.fg3_pct,
-                    'ft': stat.ft,
-                    'fta': stat.fta,
-                    'ft_pct': stat.ft_pct,
-                    'orb': stat.orb,
-                    'drb': stat.drb,
-                    'trb': stat.trb,
-                    'ast': stat.ast,
-                    'stl': stat.stl,
-                    'blk': stat.blk,
-                    'tov': stat.tov,
-                    'pf': stat.pf,
-                    'pts': stat.pts,
-                    'ts_pct': stat.ts_pct,
-                    'efg_pct': stat.efg_pct,
-                    'off_rtg': stat.off_rtg,
-                    'def_rtg': stat.def_rtg,
-                })
-            
-            return pd.DataFrame(data)
+            exact = session.execute(
+                select(PlayerGameStats.player_name)
+                .where(PlayerGameStats.player_name == player_name)
+                .limit(1)
+            ).scalar()
         finally:
             session.close()
-    
+
+        if exact is not None:
+            return PlayerGameStats.player_name == player_name
+        return PlayerGameStats.player_name.like(f"%{player_name}%")
+
     def get_player_stats(self, player_name: str, season: Optional[int] = None) -> pd.DataFrame:
         """Get player statistics as a DataFrame"""
-        session = self.get_session()
-        try:
-            query = session.query(PlayerGameStats).filter(
-                PlayerGameStats.player_name.like(f"%{player_name}%")
-            )
-            
-            if season:
-                # Join with Game to filter by season
-                query = query.join(Game, PlayerGameStats.game_id == Game.game_id).filter(Game.season == season)
-            
-            results = query.all()
-            data = []
-            for stat in results:
-                data.append({
-                    'game_id': stat.game_id,
-                    'team': stat.team,
-                    'player_name': stat.player_name,
-                    'mp': stat.mp,
-                    'fg': stat.fg,
-                    'fga': stat.fga,
-                    'fg_pct': stat.fg_pct,
-                    'fg3': stat.fg3,
-                    'fg3a': stat.fg3a,
-                    'fg3_pct': stat.fg3_pct,
-                    'ft': stat.ft,
-                    'fta': stat.fta,
-                    'ft_pct': stat.ft_pct,
-                    'orb': stat.orb,
-                    'drb': stat.drb,
-                    'trb': stat.trb,
-                    'ast': stat.ast,
-                    'stl': stat.stl,
-                    'blk': stat.blk,
-                    'tov': stat.tov,
-                    'pf': stat.pf,
-                    'pts': stat.pts,
-                    'plus_minus': stat.plus_minus,
-                    'ts_pct': stat.ts_pct,
-                    'efg_pct': stat.efg_pct,
-                    'bpm': stat.bpm,
-                })
-            
-            return pd.DataFrame(data)
-        finally:
-            session.close()
-    
+        stmt = (
+            select(PlayerGameStats.game_id, PlayerGameStats.team, PlayerGameStats.player_name,
+                   *(getattr(PlayerGameStats, c) for c in PLAYER_STAT_COLS))
+            .where(self._player_name_filter(player_name))
+        )
+
+        if season:
+            # Join with Game to filter by season
+            stmt = stmt.join(Game, PlayerGameStats.game_id == Game.game_id).where(Game.season == season)
+
+        return pd.read_sql_query(stmt, self.engine)
+
+    def get_player_stats_columns(self, player_name: str,
+                                 season: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Player stats as plain column arrays
+
+        For callers that reduce the result to a few scalars, this skips
+        the DataFrame's per-column Index/Block construction: rows come
+        off the cursor once and are transposed straight into numpy
+        arrays keyed by column name.
+        """
+        stmt = (
+            select(PlayerGameStats.game_id, PlayerGameStats.team, PlayerGameStats.player_name,
+                   *(getattr(PlayerGameStats, c) for c in PLAYER_STAT_COLS))
+            .where(self._player_name_filter(player_name))
+        )
+
+        if season:
+            stmt = stmt.join(Game, PlayerGameStats.game_id == Game.game_id).where(Game.season == season)
+
+        with self.engine.connect() as conn:
+            result = conn.execute(stmt)
+            keys = list(result.keys())
+            rows = result.fetchall()
+
+        columns = zip(*rows) if rows else ((),) * len(keys)
+        return {key: np.asarray(col) for key, col in zip(keys, columns)}
+
     def get_game_details(self, game_id: str) -> Optional[Dict]:
         """Get complete game details including all stats"""
-        session = self.get_session()
-        try:
-            game = session.query(Game).options(
-                joinedload(Game.home_stats),
-                joinedload(Game.away_stats),
-                joinedload(Game.officials)
-            ).filter(Game.game_id == game_id).first()
-            
-            if not game:
-                return None
-            
-            # Get player stats for this game
-            player_stats = session.query(PlayerGameStats).filter(
-                PlayerGameStats.game_id == game_id
-            ).all()
-            
-            return {
-                'game': {
-                    'id': game.id,
-                    'game_id': game.game_id,
-                    'date': game.date,
-                    'season': game.season,
-                    'home_team': game.home_team,
-                    'away_team': game.away_team,
-                    'home_score': game.home_score,
-                    'away_score': game.away_score,
-                    'home_won': game.home_won,
-                },
-                'team_stats': [
-                    {
-                        'team': stat.team,
-                        'is_home': stat.is_home,
-                        'fg': stat.fg,
-                        'fga': stat.fga,
-                        'fg_pct': stat.fg_pct,
-                        'fg3': stat.fg3,
-                        'fg3a': stat.fg3a,
-                        'fg3_pct': stat.fg3_pct,
-                        'ft': stat.ft,
-                        'fta': stat.fta,
-                        'ft_pct': stat.ft_pct,
-                        'orb': stat.orb,
-                        'drb': stat.drb,
-                        'trb': stat.trb,
-                        'ast': stat.ast,
-                        'stl': stat.stl,
-                        'blk': stat.blk,
-                        'tov': stat.tov,
-                        'pf': stat.pf,
-                        'pts': stat.pts,
-                        'ts_pct': stat.ts_pct,
-                        'efg_pct': stat.efg_pct,
-                        'off_rtg': stat.off_rtg,
-                        'def_rtg': stat.def_rtg,
-                    }
-                    for stat in game.home_stats + game.away_stats
-                ],
-                'player_stats': [
-                    {
-                        'team': stat.team,
-                        'player_name': stat.player_name,
-                        'mp': stat.mp,
-                        'fg': stat.fg,
-                        'fga': stat.fga,
-                        'fg_pct': stat.fg_pct,
-                        'fg3': stat.fg3,
-                        'fg3a': stat.fg3a,
-                        'fg3_pct': stat.fg3_pct,
-                        'ft': stat.ft,
-                        'fta': stat.fta,
-                        'ft_pct': stat.ft_pct,
-                        'orb': stat.orb,
-                        'drb': stat.drb,
-                        'trb': stat.trb,
-                        'ast': stat.ast,
-                        'stl': stat.stl,
-                        'blk': stat.blk,
-                        'tov': stat.tov,
-                        'pf': stat.pf,
-                        'pts': stat.pts,
-                        'plus_minus': stat.plus_minus,
-                        'ts_pct': stat.ts_pct,
-                        'efg_pct': stat.efg_pct,
-                        'bpm': stat.bpm,
-                    }
-                    for stat in player_stats
-                ],
-                'officials': [
-                    {
-                        'name': official.official_name,
-                        'url': official.official_url,
-                        'position': official.position,
-                    }
-                    for official in game.officials
-                ],
-            }
-        finally:
-            session.close()
-    
+        # Core rows instead of ORM objects: every field below would
+        # otherwise go through an InstrumentedAttribute descriptor,
+        # and .mappings() rows are already dict-shaped
+        game_stmt = (
+            select(Game.id, Game.game_id, Game.date, Game.season,
+                   Game.home_team, Game.away_team, Game.home_score,
+                   Game.away_score, Game.home_won)
+            .where(Game.game_id == game_id)
+        )
+
+        # Both teams' stats come from one game_id-keyed query; the
+        # home_stats/away_stats relationships hang off secondary FK
+        # columns and needed merging in Python anyway
+        team_stmt = (
+            select(TeamGameStats.team, TeamGameStats.is_home,
+                   *(getattr(TeamGameStats, c) for c in TEAM_STAT_COLS))
+            .where(TeamGameStats.game_id == game_id)
+        )
+
+        player_stmt = (
+            select(PlayerGameStats.team, PlayerGameStats.player_name,
+                   *(getattr(PlayerGameStats, c) for c in PLAYER_STAT_COLS))
+            .where(PlayerGameStats.game_id == game_id)
+        )
+
+        officials_stmt = (
+            select(GameOfficial.official_name.label('name'),
+                   GameOfficial.official_url.label('url'),
+                   GameOfficial.position)
+            .where(GameOfficial.game_id == game_id)
+        )
+
+        def fetch_all(stmt):
+            with self.engine.connect() as conn:
+                return conn.execute(stmt).mappings().all()
+
+        # The four selects are independent, so run them on separate
+        # pooled connections at once: latency is the slowest query
+        # rather than the sum of all four
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            game_rows, team_stats, player_stats, officials = pool.map(
+                fetch_all, (game_stmt, team_stmt, player_stmt, officials_stmt)
+            )
+
+        if not game_rows:
+            return None
+
+        return {
+            'game': dict(game_rows[0]),
+            'team_stats': [dict(row) for row in team_stats],
+            'player_stats': [dict(row) for row in player_stats],
+            'officials': [dict(row) for row in officials],
+        }
+
     def get_team_standings(self, season: int) -> pd.DataFrame:
         """Get team standings for a season"""
+        return self._cached(('team_standings', season), lambda: self._query_team_standings(season))
+
+    def _query_team_standings(self, season: int) -> pd.DataFrame:
+        # Each game contributes one row per side; the database then does
+        # the per-team reduction instead of every Game being hydrated
+        # into Python and tallied in a dict loop
+        home = select(
+            Game.home_team.label('team'),
+            case((Game.home_won, 1), else_=0).label('win'),
+            Game.home_score.label('points_for'),
+            Game.away_score.label('points_against'),
+        ).where(Game.season == season)
+
+        away = select(
+            Game.away_team.label('team'),
+            case((Game.home_won, 0), else_=1).label('win'),
+            Game.away_score.label('points_for'),
+            Game.home_score.label('points_against'),
+        ).where(Game.season == season)
+
+        sides = union_all(home, away).subquery()
+        stmt = select(
+            sides.c.team,
+            func.sum(sides.c.win).label('wins'),
+            (func.count() - func.sum(sides.c.win)).label('losses'),
+            func.sum(sides.c.points_for).label('points_for'),
+            func.sum(sides.c.points_against).label('points_against'),
+        ).group_by(sides.c.team)
+
+        df = pd.read_sql_query(stmt, self.engine)
+
+        # Derived columns vectorized over the whole frame
+        games_played = df['wins'] + df['losses']
+        df['win_pct'] = (df['wins'] / games_played).where(games_played > 0, 0)
+        df['point_diff'] = df['points_for'] - df['points_against']
+        df = df[['team', 'wins', 'losses', 'win_pct',
+                 'points_for', 'points_against', 'point_diff']]
+        return df.sort_values('wins', ascending=False)
+    
+    def get_player_season_stats(self, player_name: str, season: int) -> Dict:
+        """Get aggregated player stats for a season"""
+        # One aggregate row from the database instead of hydrating every
+        # game into a DataFrame just to sum/mean it down to scalars
+        stmt = (
+            select(
+                func.count().label('games_played'),
+                *(func.sum(getattr(PlayerGameStats, c)).label(f'sum_{c}')
+                  for c in PLAYER_TOTAL_COLS),
+                *(func.avg(getattr(PlayerGameStats, c)).label(f'avg_{c}')
+                  for c in PLAYER_AVG_COLS),
+            )
+            .join(Game, PlayerGameStats.game_id == Game.game_id)
+            .where(self._player_name_filter(player_name))
+            .where(Game.season == season)
+        )
+
         session = self.get_session()
         try:
-            # Get all games for the season
-            games = session.query(Game).filter(Game.season == season).all()
-            
-            # Calculate standings
-            standings = {}
-            for game in games:
-                # Home team
-                if game.home_team not in standings:
-                    standings[game.home_team] = {'wins': 0, 'losses': 0, 'points_for': 0, 'points_against': 0}
-                
-                if game.home_won:
-                    standings[game.home_team]['wins'] += 1
-                else:
-                    standings[game.home_team]['losses'] += 1
-                
-                standings[game.home_team]['points_for'] += game.home_score
-                standings[game.home_team]['points_against'] += game.away_score
-                
-                # Away team
-                if game.away_team not in standings:
-                    standings[game.away_team] = {'wins': 0, 'losses': 0, 'points_for': 0, 'points_against': 0}
-                
-                if not game.home_won:
-                    standings[game.away_team]['wins'] += 1
-                else:
-                    standings[game.away_team]['losses'] += 1
-                
-                standings[game.away_team]['points_for'] += game.away_score
-                standings[game.away_team]['points_against'] += game.home_score
-            
-            # Convert to DataFrame and sort by wins
-            data = []
-            for team, stats in standings.items():
-                data.append({
-                    'team': team,
-                    'wins': stats['wins'],
-                    'losses': stats['losses'],
-                    'win_pct': stats['wins'] / (stats['wins'] + stats['losses']) if (stats['wins'] + stats['losses']) > 0 else 0,
-                    'points_for': stats['points_for'],
-                    'points_against': stats['points_against'],
-                    'point_diff': stats['points_for'] - stats['points_against'],
-                })
-            
-            df = pd.DataFrame(data)
-            return df.sort_values('wins', ascending=False)
+            row = session.execute(stmt).one()._mapping
         finally:
             session.close()
-    
-    def get_player_season_stats(self, player_name: str, season: int) -> Dict:
-        """Get aggregated player stats for a season"""
-        df = self.get_player_stats(player_name, season)
-        
-        if df.empty:
+
+        if not row['games_played']:
             return {}
-        
-        # Calculate season totals and averages
-        totals = df.sum(numeric_only=True)
-        averages = df.mean(numeric_only=True)
-        
+
         return {
             'player_name': player_name,
             'season': season,
-            'games_played': len(df),
-            'totals': {
-                'fg': int(totals['fg']),
-                'fga': int(totals['fga']),
-                'fg3': int(totals['fg3']),
-                'fg3a': int(totals['fg3a']),
-                'ft': int(totals['ft']),
-                'fta': int(totals['fta']),
-                'orb': int(totals['orb']),
-                'drb': int(totals['drb']),
-                'trb': int(totals['trb']),
-                'ast': int(totals['ast']),
-                'stl': int(totals['stl']),
-                'blk': int(totals['blk']),
-                'tov': int(totals['tov']),
-                'pf': int(totals['pf']),
-                'pts': int(totals['pts']),
-            },
+            'games_played': row['games_played'],
+            'totals': {c: int(row[f'sum_{c}']) for c in PLAYER_TOTAL_COLS},
             'averages': {
-                'fg': round(averages['fg'], 1),
-                'fga': round(averages['fga'], 1),
-                'fg_pct': round(averages['fg_pct'], 3),
-                'fg3': round(averages['fg3'], 1),
-                'fg3a': round(averages['fg3a'], 1),
-                'fg3_pct': round(averages['fg3_pct'], 3),
-                'ft': round(averages['ft'], 1),
-                'fta': round(averages['fta'], 1),
-                'ft_pct': round(averages['ft_pct'], 3),
-                'orb': round(averages['orb'], 1),
-                'drb': round(averages['drb'], 1),
-                'trb': round(averages['trb'], 1),
-                'ast': round(averages['ast'], 1),
-                'stl': round(averages['stl'], 1),
-                'blk': round(averages['blk'], 1),
-                'tov': round(averages['tov'], 1),
-                'pf': round(averages['pf'], 1),
-                'pts': round(averages['pts'], 1),
-                'plus_minus': round(averages['plus_minus'], 1),
-                'ts_pct': round(averages['ts_pct'], 3),
-                'efg_pct': round(averages['efg_pct'], 3),
-                'bpm': round(averages['bpm'], 1),
-            }
+                # Percentages keep three decimals, counting stats one
+                c: round(row[f'avg_{c}'], 3 if c.endswith('pct') else 1)
+                for c in PLAYER_AVG_COLS
+            },
         }
     
+    def bulk_upsert_games(self, rows: List[Dict]):
+        """Insert game rows in bulk, skipping ids that already exist
+
+        One Core executemany sends the whole batch as multi-valued
+        INSERTs (insertmanyvalues pages of 10k), instead of the ORM
+        add-and-flush per row that writers tend to reach for.
+        """
+        if not rows:
+            return
+
+        with self.engine.begin() as conn:
+            existing = set(conn.execute(
+                select(Game.game_id).where(
+                    Game.game_id.in_([r['game_id'] for r in rows])
+                )
+            ).scalars())
+
+            new_rows = [r for r in rows if r['game_id'] not in existing]
+            if new_rows:
+                conn.execute(Game.__table__.insert(), new_rows)
+
     def get_database_stats(self) -> Dict:
         """Get database statistics"""
+        return self._cached('database_stats', self._query_database_stats)
+
+    def _query_database_stats(self) -> Dict:
         session = self.get_session()
         try:
-            game_count = session.query(Game).count()
-            team_stats_count = session.query(TeamGameStats).count()
-            player_stats_count = session.query(PlayerGameStats).count()
-            officials_count = session.query(GameOfficial).count()
-            
-            # Get season range
-            seasons = session.query(Game.season).distinct().all()
-            season_list = [s[0] for s in seasons]
-            
+            # One statement carries all four counts and the date range;
+            # MIN/MAX replace the two ORDER BY ... LIMIT 1 sorts
+            row = session.execute(select(
+                func.min(Game.date).label('earliest'),
+                func.max(Game.date).label('latest'),
+                select(func.count()).select_from(Game).scalar_subquery().label('total_games'),
+                select(func.count()).select_from(TeamGameStats).scalar_subquery().label('total_team_stats'),
+                select(func.count()).select_from(PlayerGameStats).scalar_subquery().label('total_player_stats'),
+                select(func.count()).select_from(GameOfficial).scalar_subquery().label('total_officials'),
+            )).one()._mapping
+
+            seasons = session.execute(
+                select(Game.season).distinct().order_by(Game.season)
+            ).scalars().all()
+
             return {
-                'total_games': game_count,
-                'total_team_stats': team_stats_count,
-                'total_player_stats': player_stats_count,
-                'total_officials': officials_count,
-                'seasons': sorted(season_list),
+                'total_games': row['total_games'],
+                'total_team_stats': row['total_team_stats'],
+                'total_player_stats': row['total_player_stats'],
+                'total_officials': row['total_officials'],
+                'seasons': list(seasons),
                 'date_range': {
-                    'earliest': session.query(Game.date).order_by(Game.date.asc()).first()[0].strftime('%Y-%m-%d'),
-                    'latest': session.query(Game.date).order_by(Game.date.desc()).first()[0].strftime('%Y-%m-%d'),
+                    'earliest': row['earliest'].strftime('%Y-%m-%d'),
+                    'latest': row['latest'].strftime('%Y-%m-%d'),
                 }
             }
         finally:
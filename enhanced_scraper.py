@@ -1,79 +1,424 @@
 import asyncio
+import os
 import aiohttp
-from bs4 import BeautifulSoup
+import lxml.html
+import numpy as np
+import pandas as pd
+from io import StringIO
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 from loguru import logger
 from typing import List, Dict, Optional, Tuple, Set
 import time
 from datetime import datetime, date
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 import re
-from asyncio_throttle import Throttler
-import json
+from urllib.parse import urlparse
+import orjson
+import functools
+import gzip
+import random
+import hashlib
+import aiofiles
+
+from sqlalchemy import select
 
 from config import settings
 from models import Game, TeamGameStats, GameOfficial, PlayerGameStats, SessionLocal
 
+# Shared parser instance so fromstring doesn't rebuild one per document
+_HTML_PARSER = lxml.html.HTMLParser(remove_pis=True, recover=True)
+
+# basketball-reference ships most stat tables inside HTML comments and
+# un-hides them with JS; stripping the markers exposes them to the parser
+# on the plain-HTTP path too
+_COMMENT_MARKERS_RE = re.compile(r'<!--|-->')
+
+# Compiled once instead of re-parsed per call in the hot parse path
+_GAME_ID_RE = re.compile(r'/(\d{9}[A-Z]{3})\.html')
+_DATE_RE = re.compile(r'(\d{4})(\d{2})(\d{2})')
+_ATTEND_RE = re.compile(r'(\d{1,3}(?:,\d{3})*)')
+_NUM_RE = re.compile(r'\d+\.?\d*')
+# Monthly schedule pages; everything else a season page links to
+# (teams, players, nav) is noise for schedule scraping
+_MONTH_PAGE_RE = re.compile(r'/leagues/NBA_\d{4}_games-')
+
+# Labels the additional-data helpers look for on a game page
+_LABEL_DIVS = ('Game Notes:', 'Injuries:', 'Venue:', 'Attendance:',
+               'Duration:', 'Start Time:', 'Pace:', 'Efficiency:')
+
+def _collect_labeled_divs(doc) -> Dict[str, object]:
+    """Map each known label to the first div carrying it, in one pass
+
+    One walk over the document's divs replaces a full-tree xpath per
+    label; stops early once every label has been seen.
+    """
+    found = {}
+    for div in doc.iter('div'):
+        text = div.text
+        if not text:
+            continue
+        for label in _LABEL_DIVS:
+            if label in text and label not in found:
+                found[label] = div
+        if len(found) == len(_LABEL_DIVS):
+            break
+    return found
+
+def _parse_doc(html: str):
+    """Parse a page once into an lxml tree"""
+    return lxml.html.fromstring(_COMMENT_MARKERS_RE.sub('', html), parser=_HTML_PARSER)
+
+def _row_cells(row) -> List[str]:
+    """Extract stripped cell text from a table row"""
+    return [cell.text_content().strip() for cell in row.iter('td', 'th')]
+
+# Row labels that mean "not a player row"; frozenset lookup beats two
+# string comparisons in the per-player hot path
+_SKIP_ROWS = frozenset({'Reserves', 'Team Totals', ''})
+
+def _to_int(text: str, default: int = 0) -> int:
+    """Convert already-stripped cell text to int, defaulting on blanks"""
+    try:
+        return int(text)
+    except ValueError:
+        return default
+
+def _to_float(text: str, default: float = 0.0) -> float:
+    """Convert already-stripped cell text to float, defaulting on blanks"""
+    try:
+        return float(text)
+    except ValueError:
+        return default
+
+@functools.lru_cache(maxsize=1 << 16)
+def _date_and_season(game_id: str) -> Optional[Tuple[datetime, int]]:
+    """Derive game date and NBA season from a game id, memoized
+
+    The season spans two calendar years; games before July belong to the
+    season that started the previous year.
+    """
+    match = _DATE_RE.search(game_id)
+    if not match:
+        return None
+    year, month, day = map(int, match.groups())
+    season = year - 1 if month < 7 else year
+    return datetime(year, month, day), season
+
+def _find_labeled_div(doc, label: str):
+    """First div whose own text mentions the given label, or None"""
+    matches = doc.xpath(f'//div[contains(text(), "{label}")]')
+    return matches[0] if matches else None
+
+def _table_records(html: str, table_id: str, columns: List[str],
+                   int_cols: Set[str], float_cols: Set[str],
+                   start: int = 1) -> List[Dict]:
+    """Parse one stats table into a list of row dicts via pandas.read_html
+
+    read_html hands the whole table to lxml in one call instead of a
+    Python-level loop with a float()/int() per cell. Columns are taken
+    positionally from the given start offset; repeated in-table header
+    rows come out non-numeric and are dropped.
+    """
+    try:
+        df = pd.read_html(StringIO(_COMMENT_MARKERS_RE.sub('', html)),
+                          attrs={'id': table_id})[0]
+    except ValueError:  # No matching table on the page
+        return []
+
+    df = df.iloc[:, start:start + len(columns)]
+    df.columns = columns
+
+    numeric = [c for c in columns if c in int_cols or c in float_cols]
+    for col in numeric:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    df = df.dropna(subset=numeric)
+    for col in columns:
+        if col in int_cols:
+            df[col] = df[col].astype(int)
+        elif col not in float_cols:
+            df[col] = df[col].astype(str)
+
+    return df.to_dict('records')
+
+# Resource types a DOM-only scrape never needs; blocking them cuts page
+# weight and load time substantially
+BLOCKED_RESOURCES = {"image", "stylesheet", "font", "media"}
+
+# Upper bound on one HTTP response body (decompressed); nothing on
+# basketball-reference comes close, so anything bigger is a bad response
+# not worth buffering or parsing
+_MAX_RESPONSE_BYTES = 8 * 1024 * 1024
+
+# How long a cached page stays fresh; old box scores never change, but
+# schedules and standings do, so keep this conservative
+_CACHE_TTL_SECONDS = 24 * 3600
+
+# Ceiling on any single retry or Retry-After sleep
+_BACKOFF_CAP_SECONDS = 30.0
+
+# Sentinel for failures that retrying can't fix (404 and friends)
+_PERMANENT_FAILURE = object()
+
+def _backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff for the given retry attempt
+
+    Random spread keeps concurrent workers from retrying in lockstep
+    after a shared 429/5xx burst.
+    """
+    return random.uniform(0, min(_BACKOFF_CAP_SECONDS,
+                                 settings.REQUEST_DELAY * (2 ** attempt)))
+
+async def _block_static_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+class AsyncTokenBucket:
+    """Token-bucket rate limiter that sleeps outside its lock
+
+    asyncio_throttle's Throttler holds its internal state while waiters
+    sleep, which serializes concurrent acquirers even when tokens are
+    available. Here the lock is held only long enough to refill and take
+    a token; the actual sleep happens outside it, so waiters don't block
+    each other.
+    """
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate  # tokens added per second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            await asyncio.sleep(wait)
+
 class EnhancedBasketballScraper:
     def __init__(self):
-        self.throttler = Throttler(rate_limit=1, period=1)  # 1 request per second
+        self._buckets = {}  # One rate-limit bucket per host
+        self.cache_dir = Path(settings.DATA_DIR) / '.cache'
         self.session = None
         self.browser = None
-        self.page = None
+        self.pages = None  # Pool of pre-warmed pages shared by all fetches
         self.scraped_games = set()  # Track already scraped games
-        
+
     async def __aenter__(self):
         """Async context manager entry"""
         self.session = aiohttp.ClientSession(
-            headers={'User-Agent': settings.USER_AGENT},
-            timeout=aiohttp.ClientTimeout(total=settings.TIMEOUT)
+            headers={
+                'User-Agent': settings.USER_AGENT,
+                # Ask for compressed bodies; these pages shrink 5-8x
+                'Accept-Encoding': 'gzip, br',
+            },
+            timeout=aiohttp.ClientTimeout(total=settings.TIMEOUT, sock_connect=5),
+            auto_decompress=True,
+            read_bufsize=65536,
+            # One shared connector for every task: warm keep-alive
+            # connections, a per-host cap matching the rate limiter, and
+            # eager cleanup of closed SSL transports so long runs don't
+            # accumulate half-dead connections
+            connector=aiohttp.TCPConnector(
+                limit=50,
+                limit_per_host=10,
+                keepalive_timeout=30,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
         )
         self.playwright = await async_playwright().start()
         self.browser = await self.playwright.firefox.launch(headless=settings.HEADLESS)
-        self.page = await self.browser.new_page()
+        # One page per concurrency slot so gathered fetches never share a
+        # page mid-navigation
+        self.pages = asyncio.Queue()
+        for _ in range(settings.MAX_CONCURRENCY):
+            page = await self.browser.new_page()
+            await page.route("**/*", _block_static_resources)
+            self.pages.put_nowait(page)
+        # Bounds how many fetches are in flight when callers gather()
+        self._sem = asyncio.Semaphore(settings.MAX_CONCURRENCY)
+        # Game-page parsing is CPU-bound; a process pool keeps it off the
+        # event-loop thread so I/O stays concurrent while parsing scales
+        # across cores
+        self._pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        # Seed the dedup set from the database so a cold start doesn't
+        # redo Playwright navigations for games saved by earlier runs
+        db = SessionLocal()
+        try:
+            self.scraped_games.update(db.execute(select(Game.game_id)).scalars())
+        finally:
+            db.close()
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
         if self.session:
             await self.session.close()
-        if self.page:
-            await self.page.close()
+            # Give SSL transports a beat to release before teardown
+            await asyncio.sleep(0.25)
+        if self.pages:
+            while not self.pages.empty():
+                await self.pages.get_nowait().close()
+        if getattr(self, '_pool', None):
+            self._pool.shutdown()
         if self.browser:
             await self.browser.close()
         if self.playwright:
             await self.playwright.stop()
     
-    async def get_html_with_retry(self, url: str, selector: str = "body", max_retries: int = None) -> Optional[str]:
-        """Get HTML content with retry logic and rate limiting"""
+    def _cache_path(self, url: str) -> Path:
+        """Content-addressed cache location for a URL"""
+        key = hashlib.sha1(url.encode()).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.html.gz"
+
+    async def _cache_get(self, url: str) -> Optional[str]:
+        """Return the cached page for a URL if present and fresh"""
+        path = self._cache_path(url)
+        try:
+            if time.time() - path.stat().st_mtime > _CACHE_TTL_SECONDS:
+                return None
+            async with aiofiles.open(path, 'rb') as f:
+                data = await f.read()
+            return gzip.decompress(data).decode('utf-8')
+        except OSError:
+            return None
+
+    async def _cache_put(self, url: str, html: str):
+        """Store a fetched page, compressed, under the URL's cache key"""
+        path = self._cache_path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so a crash mid-write never
+        # leaves a truncated entry behind
+        tmp = path.with_suffix('.tmp')
+        try:
+            async with aiofiles.open(tmp, 'wb') as f:
+                await f.write(gzip.compress(html.encode('utf-8')))
+            tmp.rename(path)
+        except OSError as e:
+            logger.warning(f"Could not cache {url}: {e}")
+
+    def _bucket_for(self, url: str) -> AsyncTokenBucket:
+        """Get (or create) the rate-limit bucket for a URL's host"""
+        host = urlparse(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = AsyncTokenBucket(rate=1.0)  # 1 request per second
+        return bucket
+
+    async def _fetch_http(self, url: str, selector: str):
+        """Fetch a page over plain HTTP
+
+        Returns the HTML, None if the browser fallback should try, or
+        _PERMANENT_FAILURE when retrying can't help.
+        """
+        try:
+            async with self.session.get(url) as response:
+                if response.status == 404:
+                    logger.warning(f"{url} returned 404, not retrying")
+                    return _PERMANENT_FAILURE
+                if response.status in (429, 503):
+                    # The server told us when to come back; honor it
+                    retry_after = response.headers.get('Retry-After')
+                    if retry_after:
+                        try:
+                            await asyncio.sleep(min(float(retry_after), _BACKOFF_CAP_SECONDS))
+                        except ValueError:
+                            pass
+                    return None
+                if response.status != 200:
+                    return None
+                # Stream the decompressed body so an oversized response is
+                # abandoned mid-transfer instead of buffered whole
+                chunks = []
+                size = 0
+                async for chunk in response.content.iter_chunked(16384):
+                    size += len(chunk)
+                    if size > _MAX_RESPONSE_BYTES:
+                        logger.warning(f"Response for {url} exceeded size cap, skipping")
+                        return None
+                    chunks.append(chunk)
+                html = b''.join(chunks).decode(response.get_encoding(), 'replace')
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+
+        # Only trust the fast path if the element the browser would have
+        # waited for is actually in the served markup
+        id_match = re.match(r'#([\w-]+)', selector)
+        if id_match and f'id="{id_match.group(1)}"' not in html:
+            return None
+
+        return html
+
+    async def get_html_with_retry(self, url: str, selector: str = "body", max_retries: int = None, use_browser: bool = False) -> Optional[str]:
+        """Get HTML content with retry logic and rate limiting
+
+        These pages are server-rendered, so by default we try a plain HTTP
+        GET first - no browser startup cost, no networkidle wait - and only
+        fall back to Playwright when the response is missing the expected
+        element (blocked, rate limited, or genuinely dynamic). Pass
+        use_browser=True to skip the fast path entirely.
+        """
         max_retries = max_retries or settings.MAX_RETRIES
-        
+
+        # Re-runs and debugging iterations hit the disk cache, not the site
+        html = await self._cache_get(url)
+        if html:
+            return html
+
+        if not use_browser:
+            async with self._sem:
+                await self._bucket_for(url).acquire()
+                html = await self._fetch_http(url, selector)
+            if html is _PERMANENT_FAILURE:
+                return None
+            if html:
+                await self._cache_put(url, html)
+                return html
+
         for attempt in range(max_retries):
             try:
-                async with self.throttler:
-                    await self.page.goto(url, wait_until="networkidle")
-                    await asyncio.sleep(settings.REQUEST_DELAY)
-                    
-                    if selector == "body":
-                        html = await self.page.content()
-                    else:
-                        element = await self.page.wait_for_selector(selector, timeout=10000)
-                        html = await element.inner_html()
-                    
+                async with self._sem:
+                    await self._bucket_for(url).acquire()
+                    page = await self.pages.get()
+                    try:
+                        # domcontentloaded is enough: the selector wait
+                        # below covers late content, and networkidle just
+                        # tails analytics beacons we blocked anyway
+                        await page.goto(url, wait_until="domcontentloaded", timeout=15000)
+
+                        if selector == "body":
+                            html = await page.content()
+                        else:
+                            element = await page.wait_for_selector(selector, timeout=10000)
+                            html = await element.inner_html()
+                    finally:
+                        self.pages.put_nowait(page)
+
+                    if html:
+                        await self._cache_put(url, html)
                     return html
-                    
+
             except PlaywrightTimeout:
                 logger.warning(f"Timeout on attempt {attempt + 1} for {url}")
                 if attempt == max_retries - 1:
                     logger.error(f"Failed to load {url} after {max_retries} attempts")
                     return None
-                await asyncio.sleep(settings.REQUEST_DELAY * (attempt + 1))
-                
+                await asyncio.sleep(_backoff_delay(attempt))
+
             except Exception as e:
                 logger.error(f"Error fetching {url}: {e}")
                 if attempt == max_retries - 1:
                     return None
-                await asyncio.sleep(settings.REQUEST_DELAY * (attempt + 1))
+                await asyncio.sleep(_backoff_delay(attempt))
         
         return None
     
@@ -98,26 +443,36 @@ class EnhancedBasketballScraper:
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
-        links = soup.find_all("a")
-        schedule_pages = [f"{settings.BASE_URL}{l['href']}" for l in links if l.get('href')]
+        doc = _parse_doc(html)
+        schedule_pages = [f"{settings.BASE_URL}{href}"
+                          for href in doc.xpath('//a/@href')
+                          if _MONTH_PAGE_RE.search(href)]
         
-        game_urls = []
-        for schedule_url in schedule_pages:
-            html = await self.get_html_with_retry(schedule_url, "#all_schedule")
-            if not html:
+        # Fetch the monthly schedule pages concurrently; the semaphore in
+        # get_html_with_retry keeps the fan-out bounded
+        results = await asyncio.gather(
+            *[self.get_html_with_retry(url, "#all_schedule") for url in schedule_pages],
+            return_exceptions=True
+        )
+
+        # Box-score links repeat across overlapping month pages, so
+        # collect into a set instead of deduping downstream
+        game_urls = set()
+        for html in results:
+            if not html or isinstance(html, Exception):
                 continue
-                
-            soup = BeautifulSoup(html, 'html.parser')
-            links = soup.find_all("a")
-            box_scores = [
-                f"{settings.BASE_URL}{l['href']}" 
-                for l in links 
-                if l.get('href') and "boxscore" in l['href'] and '.html' in l['href']
-            ]
-            game_urls.extend(box_scores)
-        
-        return game_urls
+
+            doc = _parse_doc(html)
+            game_urls.update(
+                f"{settings.BASE_URL}{href}"
+                for href in doc.xpath('//a/@href')
+                if "boxscore" in href and '.html' in href
+            )
+
+        # Drop games already in the database before anything is
+        # dispatched; sorted for a deterministic scrape order
+        return sorted(url for url in game_urls
+                      if self.parse_game_id(url) not in self.scraped_games)
     
     async def scrape_comprehensive_game_data(self, url: str) -> Optional[Dict]:
         """Scrape comprehensive game data including additional sources"""
@@ -134,58 +489,45 @@ class EnhancedBasketballScraper:
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'html.parser')
-        
         try:
-            # Parse basic game info
-            game_data = self._parse_basic_game_info(soup, game_id)
+            # Parsing is CPU-bound; run it in the worker pool so the
+            # event loop keeps serving other page loads meanwhile
+            loop = asyncio.get_running_loop()
+            game_data = await loop.run_in_executor(self._pool, _parse_all, html, game_id)
             if not game_data:
                 return None
-            
-            # Parse team stats
-            team_stats = self._parse_team_stats(soup, game_id)
-            game_data['team_stats'] = team_stats
-            
-            # Parse player stats
-            player_stats = self._parse_player_stats(soup, game_id)
-            game_data['player_stats'] = player_stats
-            
-            # Parse officials
-            officials = self._parse_officials(soup, game_id)
-            game_data['officials'] = officials
-            
-            # Parse additional data sources
-            additional_data = await self._scrape_additional_data(soup, game_id)
-            game_data.update(additional_data)
-            
+
             # Mark as scraped
             self.scraped_games.add(game_id)
-            
+
             return game_data
-            
+
         except Exception as e:
             logger.error(f"Error parsing game {game_id}: {e}")
             return None
-    
-    async def _scrape_additional_data(self, soup: BeautifulSoup, game_id: str) -> Dict:
-        """Scrape additional data sources from the game page"""
+
+    def _parse_additional_data(self, doc, game_id: str) -> Dict:
+        """Parse additional data sources from the game page"""
         additional_data = {}
-        
+
         try:
+            # One pass over the page's divs feeds all four helpers
+            labeled = _collect_labeled_divs(doc)
+
             # Parse game notes and context
-            game_notes = self._parse_game_notes(soup)
+            game_notes = self._parse_game_notes(labeled)
             additional_data['game_notes'] = game_notes
-            
+
             # Parse attendance and venue info
-            venue_info = self._parse_venue_info(soup)
+            venue_info = self._parse_venue_info(labeled)
             additional_data['venue_info'] = venue_info
-            
+
             # Parse game duration and timing
-            timing_info = self._parse_timing_info(soup)
+            timing_info = self._parse_timing_info(labeled)
             additional_data['timing_info'] = timing_info
-            
+
             # Parse advanced team metrics
-            advanced_metrics = self._parse_advanced_metrics(soup)
+            advanced_metrics = self._parse_advanced_metrics(labeled)
             additional_data['advanced_metrics'] = advanced_metrics
             
         except Exception as e:
@@ -193,44 +535,42 @@ class EnhancedBasketballScraper:
         
         return additional_data
     
-    def _parse_game_notes(self, soup: BeautifulSoup) -> Dict:
+    def _parse_game_notes(self, labeled: Dict) -> Dict:
         """Parse game notes and context information"""
         notes = {}
-        
+
         try:
             # Look for game notes section
-            notes_div = soup.find('div', string=lambda text: 'Game Notes:' in str(text) if text else False)
-            if notes_div:
-                notes_text = notes_div.get_text(strip=True)
-                notes['game_notes'] = notes_text
-            
+            notes_div = labeled.get('Game Notes:')
+            if notes_div is not None:
+                notes['game_notes'] = notes_div.text_content().strip()
+
             # Look for injuries and roster changes
-            injury_info = soup.find('div', string=lambda text: 'Injuries:' in str(text) if text else False)
-            if injury_info:
-                notes['injuries'] = injury_info.get_text(strip=True)
+            injury_info = labeled.get('Injuries:')
+            if injury_info is not None:
+                notes['injuries'] = injury_info.text_content().strip()
                 
         except Exception as e:
             logger.error(f"Error parsing game notes: {e}")
         
         return notes
     
-    def _parse_venue_info(self, soup: BeautifulSoup) -> Dict:
+    def _parse_venue_info(self, labeled: Dict) -> Dict:
         """Parse venue and attendance information"""
         venue_info = {}
-        
+
         try:
             # Look for venue information
-            venue_div = soup.find('div', string=lambda text: 'Venue:' in str(text) if text else False)
-            if venue_div:
-                venue_text = venue_div.get_text(strip=True)
-                venue_info['venue'] = venue_text
-            
+            venue_div = labeled.get('Venue:')
+            if venue_div is not None:
+                venue_info['venue'] = venue_div.text_content().strip()
+
             # Look for attendance
-            attendance_div = soup.find('div', string=lambda text: 'Attendance:' in str(text) if text else False)
-            if attendance_div:
-                attendance_text = attendance_div.get_text(strip=True)
+            attendance_div = labeled.get('Attendance:')
+            if attendance_div is not None:
+                attendance_text = attendance_div.text_content().strip()
                 # Extract attendance number
-                attendance_match = re.search(r'(\d{1,3}(?:,\d{3})*)', attendance_text)
+                attendance_match = _ATTEND_RE.search(attendance_text)
                 if attendance_match:
                     venue_info['attendance'] = int(attendance_match.group(1).replace(',', ''))
                     
@@ -239,46 +579,43 @@ class EnhancedBasketballScraper:
         
         return venue_info
     
-    def _parse_timing_info(self, soup: BeautifulSoup) -> Dict:
+    def _parse_timing_info(self, labeled: Dict) -> Dict:
         """Parse game timing and duration information"""
         timing_info = {}
-        
+
         try:
             # Look for game duration
-            duration_div = soup.find('div', string=lambda text: 'Duration:' in str(text) if text else False)
-            if duration_div:
-                duration_text = duration_div.get_text(strip=True)
-                timing_info['duration'] = duration_text
-            
+            duration_div = labeled.get('Duration:')
+            if duration_div is not None:
+                timing_info['duration'] = duration_div.text_content().strip()
+
             # Look for start time
-            time_div = soup.find('div', string=lambda text: 'Start Time:' in str(text) if text else False)
-            if time_div:
-                time_text = time_div.get_text(strip=True)
-                timing_info['start_time'] = time_text
+            time_div = labeled.get('Start Time:')
+            if time_div is not None:
+                timing_info['start_time'] = time_div.text_content().strip()
                 
         except Exception as e:
             logger.error(f"Error parsing timing info: {e}")
         
         return timing_info
     
-    def _parse_advanced_metrics(self, soup: BeautifulSoup) -> Dict:
+    def _parse_advanced_metrics(self, labeled: Dict) -> Dict:
         """Parse advanced team and player metrics"""
         advanced_metrics = {}
-        
+
         try:
             # Look for pace and efficiency metrics
-            pace_div = soup.find('div', string=lambda text: 'Pace:' in str(text) if text else False)
-            if pace_div:
-                pace_text = pace_div.get_text(strip=True)
-                pace_match = re.search(r'(\d+\.?\d*)', pace_text)
+            pace_div = labeled.get('Pace:')
+            if pace_div is not None:
+                pace_text = pace_div.text_content().strip()
+                pace_match = _NUM_RE.search(pace_text)
                 if pace_match:
-                    advanced_metrics['pace'] = float(pace_match.group(1))
-            
+                    advanced_metrics['pace'] = float(pace_match.group(0))
+
             # Look for efficiency ratings
-            efficiency_div = soup.find('div', string=lambda text: 'Efficiency:' in str(text) if text else False)
-            if efficiency_div:
-                efficiency_text = efficiency_div.get_text(strip=True)
-                advanced_metrics['efficiency'] = efficiency_text
+            efficiency_div = labeled.get('Efficiency:')
+            if efficiency_div is not None:
+                advanced_metrics['efficiency'] = efficiency_div.text_content().strip()
                 
         except Exception as e:
             logger.error(f"Error parsing advanced metrics: {e}")
@@ -288,33 +625,35 @@ class EnhancedBasketballScraper:
     async def scrape_player_profiles(self, player_urls: List[str]) -> List[Dict]:
         """Scrape detailed player profile information"""
         player_profiles = []
-        
-        for url in player_urls:
-            try:
-                html = await self.get_html_with_retry(url)
-                if not html:
-                    continue
-                
-                soup = BeautifulSoup(html, 'html.parser')
-                profile = self._parse_player_profile(soup, url)
-                if profile:
-                    player_profiles.append(profile)
-                    
-            except Exception as e:
-                logger.error(f"Error scraping player profile {url}: {e}")
-        
+
+        results = await asyncio.gather(
+            *[self.get_html_with_retry(url) for url in player_urls],
+            return_exceptions=True
+        )
+
+        for url, html in zip(player_urls, results):
+            if isinstance(html, Exception):
+                logger.error(f"Error scraping player profile {url}: {html}")
+                continue
+            if not html:
+                continue
+
+            profile = self._parse_player_profile(_parse_doc(html), url)
+            if profile:
+                player_profiles.append(profile)
+
         return player_profiles
     
-    def _parse_player_profile(self, soup: BeautifulSoup, url: str) -> Optional[Dict]:
+    def _parse_player_profile(self, doc, url: str) -> Optional[Dict]:
         """Parse detailed player profile information"""
         try:
             # Extract player name
-            name_elem = soup.find('h1', {'itemprop': 'name'})
-            player_name = name_elem.get_text(strip=True) if name_elem else "Unknown"
-            
+            name_elems = doc.xpath('//h1[@itemprop="name"]')
+            player_name = name_elems[0].text_content().strip() if name_elems else "Unknown"
+
             # Extract basic info
-            info_table = soup.find('table', {'id': 'info'})
-            if not info_table:
+            info_table = doc.get_element_by_id('info', None)
+            if info_table is None:
                 return None
             
             profile = {
@@ -328,13 +667,13 @@ class EnhancedBasketballScraper:
                 'experience': None
             }
             
-            rows = info_table.find_all('tr')
+            rows = info_table.xpath('.//tr')
             for row in rows:
-                cells = row.find_all(['td', 'th'])
+                cells = _row_cells(row)
                 if len(cells) >= 2:
-                    label = cells[0].get_text(strip=True).lower()
-                    value = cells[1].get_text(strip=True)
-                    
+                    label = cells[0].lower()
+                    value = cells[1]
+
                     if 'height' in label:
                         profile['height'] = value
                     elif 'weight' in label:
@@ -365,50 +704,53 @@ class EnhancedBasketballScraper:
             'OKC', 'ORL', 'PHI', 'PHO', 'POR', 'SAC', 'SAS', 'TOR', 'UTA', 'WAS'
         ]
         
-        for team in teams:
-            try:
-                url = f"{settings.BASE_URL}/teams/{team}/{season}.html"
-                html = await self.get_html_with_retry(url)
-                
-                if html:
-                    soup = BeautifulSoup(html, 'html.parser')
-                    roster = self._parse_team_roster(soup, team, season)
-                    if roster:
-                        rosters[team] = roster
-                        logger.info(f"Scraped roster for {team} ({len(roster)} players)")
-                
-                await asyncio.sleep(0.5)  # Small delay between teams
-                
-            except Exception as e:
-                logger.error(f"Error scraping roster for {team}: {e}")
-        
+        results = await asyncio.gather(
+            *[
+                self.get_html_with_retry(f"{settings.BASE_URL}/teams/{team}/{season}.html")
+                for team in teams
+            ],
+            return_exceptions=True
+        )
+
+        for team, html in zip(teams, results):
+            if isinstance(html, Exception):
+                logger.error(f"Error scraping roster for {team}: {html}")
+                continue
+            if not html:
+                continue
+
+            roster = self._parse_team_roster(_parse_doc(html), team, season)
+            if roster:
+                rosters[team] = roster
+                logger.info(f"Scraped roster for {team} ({len(roster)} players)")
+
         return rosters
     
-    def _parse_team_roster(self, soup: BeautifulSoup, team: str, season: int) -> List[Dict]:
+    def _parse_team_roster(self, doc, team: str, season: int) -> List[Dict]:
         """Parse team roster information"""
         roster = []
-        
+
         try:
             # Find roster table
-            roster_table = soup.find('table', {'id': 'roster'})
-            if not roster_table:
+            roster_table = doc.get_element_by_id('roster', None)
+            if roster_table is None:
                 return roster
-            
-            rows = roster_table.find_all('tr')[1:]  # Skip header
+
+            rows = roster_table.xpath('.//tr')[1:]  # Skip header
             for row in rows:
-                cells = row.find_all(['td', 'th'])
+                cells = _row_cells(row)
                 if len(cells) >= 8:
                     player = {
                         'team': team,
                         'season': season,
-                        'number': cells[0].get_text(strip=True),
-                        'name': cells[1].get_text(strip=True),
-                        'position': cells[2].get_text(strip=True),
-                        'height': cells[3].get_text(strip=True),
-                        'weight': cells[4].get_text(strip=True),
-                        'birth_date': cells[5].get_text(strip=True),
-                        'college': cells[6].get_text(strip=True),
-                        'experience': cells[7].get_text(strip=True)
+                        'number': cells[0],
+                        'name': cells[1],
+                        'position': cells[2],
+                        'height': cells[3],
+                        'weight': cells[4],
+                        'birth_date': cells[5],
+                        'college': cells[6],
+                        'experience': cells[7]
                     }
                     roster.append(player)
             
@@ -446,38 +788,21 @@ class EnhancedBasketballScraper:
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
-        standings = []
-        
         try:
-            standings_table = soup.find('table', {'id': 'expanded_standings'})
-            if standings_table:
-                rows = standings_table.find_all('tr')[1:]  # Skip header
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) >= 15:
-                        standing = {
-                            'team': cells[1].get_text(strip=True),
-                            'wins': int(cells[2].get_text(strip=True)),
-                            'losses': int(cells[3].get_text(strip=True)),
-                            'win_pct': float(cells[4].get_text(strip=True)),
-                            'games_back': cells[5].get_text(strip=True),
-                            'points_for': float(cells[6].get_text(strip=True)),
-                            'points_against': float(cells[7].get_text(strip=True)),
-                            'srs': float(cells[8].get_text(strip=True)),
-                            'sos': float(cells[9].get_text(strip=True)),
-                            'off_rtg': float(cells[10].get_text(strip=True)),
-                            'def_rtg': float(cells[11].get_text(strip=True)),
-                            'pace': float(cells[12].get_text(strip=True)),
-                            'fta_per_fga': float(cells[13].get_text(strip=True)),
-                            'fg3a_per_fga': float(cells[14].get_text(strip=True))
-                        }
-                        standings.append(standing)
-            
+            return _table_records(
+                html, 'expanded_standings',
+                columns=['team', 'wins', 'losses', 'win_pct', 'games_back',
+                         'points_for', 'points_against', 'srs', 'sos',
+                         'off_rtg', 'def_rtg', 'pace', 'fta_per_fga',
+                         'fg3a_per_fga'],
+                int_cols={'wins', 'losses'},
+                float_cols={'win_pct', 'points_for', 'points_against', 'srs',
+                            'sos', 'off_rtg', 'def_rtg', 'pace',
+                            'fta_per_fga', 'fg3a_per_fga'}
+            )
         except Exception as e:
             logger.error(f"Error parsing standings for season {season}: {e}")
-        
-        return standings
+            return []
     
     async def scrape_season_leaders(self, season: int) -> Dict:
         """Scrape season statistical leaders"""
@@ -486,48 +811,38 @@ class EnhancedBasketballScraper:
         # Categories to scrape
         categories = ['pts_per_g', 'trb_per_g', 'ast_per_g', 'stl_per_g', 'blk_per_g']
         
-        for category in categories:
-            try:
-                url = f"{settings.BASE_URL}/leagues/NBA_{season}_{category}.html"
-                html = await self.get_html_with_retry(url)
-                
-                if html:
-                    soup = BeautifulSoup(html, 'html.parser')
-                    category_leaders = self._parse_leaders_table(soup, category)
-                    leaders[category] = category_leaders
-                
-                await asyncio.sleep(0.5)
-                
-            except Exception as e:
-                logger.error(f"Error scraping {category} leaders for season {season}: {e}")
-        
+        results = await asyncio.gather(
+            *[
+                self.get_html_with_retry(f"{settings.BASE_URL}/leagues/NBA_{season}_{category}.html")
+                for category in categories
+            ],
+            return_exceptions=True
+        )
+
+        for category, html in zip(categories, results):
+            if isinstance(html, Exception):
+                logger.error(f"Error scraping {category} leaders for season {season}: {html}")
+                continue
+            if not html:
+                continue
+
+            leaders[category] = self._parse_leaders_table(html, category)
+
         return leaders
     
-    def _parse_leaders_table(self, soup: BeautifulSoup, category: str) -> List[Dict]:
+    def _parse_leaders_table(self, html: str, category: str) -> List[Dict]:
         """Parse leaders table"""
-        leaders = []
-        
         try:
-            table = soup.find('table', {'id': 'stats'})
-            if table:
-                rows = table.find_all('tr')[1:]  # Skip header
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) >= 8:
-                        leader = {
-                            'rank': int(cells[0].get_text(strip=True)),
-                            'player': cells[1].get_text(strip=True),
-                            'team': cells[2].get_text(strip=True),
-                            'value': float(cells[3].get_text(strip=True)),
-                            'games': int(cells[4].get_text(strip=True)),
-                            'minutes': cells[5].get_text(strip=True)
-                        }
-                        leaders.append(leader)
-            
+            return _table_records(
+                html, 'stats',
+                columns=['rank', 'player', 'team', 'value', 'games', 'minutes'],
+                int_cols={'rank', 'games'},
+                float_cols={'value'},
+                start=0  # The rank column is part of the output here
+            )
         except Exception as e:
             logger.error(f"Error parsing leaders table for {category}: {e}")
-        
-        return leaders
+            return []
     
     async def scrape_team_advanced_stats(self, season: int) -> List[Dict]:
         """Scrape team advanced statistics"""
@@ -537,73 +852,53 @@ class EnhancedBasketballScraper:
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
-        team_stats = []
-        
+        stat_columns = ['team', 'off_rtg', 'def_rtg', 'net_rtg', 'pace',
+                        'fg_pct', 'fg3_pct', 'ft_pct', 'orb_pct', 'drb_pct',
+                        'trb_pct', 'ast_pct', 'stl_pct', 'blk_pct', 'tov_pct',
+                        'efg_pct', 'ts_pct', 'off_efficiency', 'def_efficiency']
         try:
-            # Find team stats table
-            stats_table = soup.find('table', {'id': 'advanced-team'})
-            if stats_table:
-                rows = stats_table.find_all('tr')[1:]  # Skip header
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) >= 20:
-                        team_stat = {
-                            'team': cells[1].get_text(strip=True),
-                            'off_rtg': float(cells[2].get_text(strip=True)),
-                            'def_rtg': float(cells[3].get_text(strip=True)),
-                            'net_rtg': float(cells[4].get_text(strip=True)),
-                            'pace': float(cells[5].get_text(strip=True)),
-                            'fg_pct': float(cells[6].get_text(strip=True)),
-                            'fg3_pct': float(cells[7].get_text(strip=True)),
-                            'ft_pct': float(cells[8].get_text(strip=True)),
-                            'orb_pct': float(cells[9].get_text(strip=True)),
-                            'drb_pct': float(cells[10].get_text(strip=True)),
-                            'trb_pct': float(cells[11].get_text(strip=True)),
-                            'ast_pct': float(cells[12].get_text(strip=True)),
-                            'stl_pct': float(cells[13].get_text(strip=True)),
-                            'blk_pct': float(cells[14].get_text(strip=True)),
-                            'tov_pct': float(cells[15].get_text(strip=True)),
-                            'efg_pct': float(cells[16].get_text(strip=True)),
-                            'ts_pct': float(cells[17].get_text(strip=True)),
-                            'off_efficiency': float(cells[18].get_text(strip=True)),
-                            'def_efficiency': float(cells[19].get_text(strip=True))
-                        }
-                        team_stats.append(team_stat)
-            
+            return _table_records(
+                html, 'advanced-team',
+                columns=stat_columns,
+                int_cols=set(),
+                float_cols=set(stat_columns) - {'team'}
+            )
         except Exception as e:
             logger.error(f"Error parsing team advanced stats for season {season}: {e}")
-        
-        return team_stats
+            return []
     
     # Inherit existing parsing methods from the original scraper
-    def parse_game_id(self, url: str) -> str:
-        """Extract game ID from URL"""
-        match = re.search(r'/(\d{9}[A-Z]{3})\.html', url)
+    @staticmethod
+    @functools.lru_cache(maxsize=1 << 16)
+    def parse_game_id(url: str) -> str:
+        """Extract game ID from URL
+
+        Called for every URL seen (dedup filtering re-checks the same
+        ones), so the regex result is memoized on the URL string.
+        """
+        match = _GAME_ID_RE.search(url)
         return match.group(1) if match else url.split('/')[-1].replace('.html', '')
     
-    def _parse_basic_game_info(self, soup: BeautifulSoup, game_id: str) -> Optional[Dict]:
+    def _parse_basic_game_info(self, doc, game_id: str) -> Optional[Dict]:
         """Parse basic game information"""
         try:
             # Get line score
-            line_score_table = soup.find('table', {'id': 'line_score'})
-            if not line_score_table:
+            line_score_table = doc.get_element_by_id('line_score', None)
+            if line_score_table is None:
                 return None
-            
-            rows = line_score_table.find_all('tr')[1:]  # Skip header
+
+            rows = line_score_table.xpath('.//tr')[1:]  # Skip header
             if len(rows) < 2:
                 return None
-            
+
             teams = []
             scores = []
-            
+
             for row in rows:
-                cells = row.find_all(['td', 'th'])
+                cells = _row_cells(row)
                 if len(cells) >= 2:
-                    team = cells[0].get_text(strip=True)
-                    total_score = int(cells[-1].get_text(strip=True))
-                    teams.append(team)
-                    scores.append(total_score)
+                    teams.append(cells[0])
+                    scores.append(int(cells[-1]))
             
             if len(teams) != 2 or len(scores) != 2:
                 return None
@@ -613,18 +908,13 @@ class EnhancedBasketballScraper:
             away_score, home_score = scores
             home_won = home_score > away_score
             
-            # Get date from URL or page
-            date_match = re.search(r'(\d{4})(\d{2})(\d{2})', game_id)
-            if date_match:
-                year, month, day = date_match.groups()
-                game_date = datetime(int(year), int(month), int(day))
+            # Get date and season from the game id
+            dated = _date_and_season(game_id)
+            if dated:
+                game_date, season = dated
             else:
                 game_date = datetime.now()
-            
-            # Get season
-            season = game_date.year
-            if game_date.month < 7:  # NBA season spans two calendar years
-                season -= 1
+                season = game_date.year - 1 if game_date.month < 7 else game_date.year
             
             return {
                 'game_id': game_id,
@@ -641,20 +931,20 @@ class EnhancedBasketballScraper:
             logger.error(f"Error parsing basic game info: {e}")
             return None
     
-    def _parse_team_stats(self, soup: BeautifulSoup, game_id: str) -> List[Dict]:
-        """Parse team statistics"""
+    def _parse_team_stats(self, tables: Dict, game_id: str) -> List[Dict]:
+        """Parse team statistics from the id-indexed tables"""
         team_stats = []
-        
+
         try:
             for team in ['home', 'away']:
-                basic_table = soup.find('table', {'id': f'box-{team}-game-basic'})
-                advanced_table = soup.find('table', {'id': f'box-{team}-game-advanced'})
-                
-                if not basic_table:
+                basic_table = tables.get(f'box-{team}-game-basic')
+                advanced_table = tables.get(f'box-{team}-game-advanced')
+
+                if basic_table is None:
                     continue
-                
+
                 basic_stats = self._parse_stats_table(basic_table, 'basic')
-                advanced_stats = self._parse_stats_table(advanced_table, 'advanced') if advanced_table else {}
+                advanced_stats = self._parse_stats_table(advanced_table, 'advanced') if advanced_table is not None else {}
                 
                 team_stat = {
                     'game_id': game_id,
@@ -671,20 +961,19 @@ class EnhancedBasketballScraper:
         
         return team_stats
     
-    def _parse_player_stats(self, soup: BeautifulSoup, game_id: str) -> List[Dict]:
-        """Parse individual player statistics"""
+    def _parse_player_stats(self, tables: Dict, game_id: str) -> List[Dict]:
+        """Parse individual player statistics from the id-indexed tables"""
         player_stats = []
-        
+
         try:
             for team in ['home', 'away']:
-                basic_table = soup.find('table', {'id': f'box-{team}-game-basic'})
-                advanced_table = soup.find('table', {'id': f'box-{team}-game-advanced'})
-                
-                if not basic_table:
+                basic_table = tables.get(f'box-{team}-game-basic')
+
+                if basic_table is None:
                     continue
-                
-                rows = basic_table.find_all('tr')[1:-1]  # Skip header and totals
-                
+
+                rows = basic_table.xpath('.//tr')[1:-1]  # Skip header and totals
+
                 for row in rows:
                     player_stat = self._parse_player_row(row, game_id, team)
                     if player_stat:
@@ -698,40 +987,46 @@ class EnhancedBasketballScraper:
     def _parse_player_row(self, row, game_id: str, team: str) -> Optional[Dict]:
         """Parse a single player row"""
         try:
-            cells = row.find_all(['td', 'th'])
+            cells = _row_cells(row)
             if len(cells) < 10:
                 return None
-            
-            player_name = cells[0].get_text(strip=True)
-            if not player_name or player_name in ['Reserves', 'Team Totals']:
+
+            player_name = cells[0]
+            if player_name in _SKIP_ROWS:
                 return None
-            
+
+            # Pad short rows once to the full box-score width; extraction
+            # below is then straight-line indexing with no per-field
+            # length guard (empty strings convert to the same defaults)
+            if len(cells) < 21:
+                cells = cells + [''] * (21 - len(cells))
+
             stats = {
                 'game_id': game_id,
                 'team': team,
                 'player_name': player_name,
-                'mp': cells[1].get_text(strip=True) if len(cells) > 1 else '0',
-                'fg': self._safe_int(cells[2]) if len(cells) > 2 else 0,
-                'fga': self._safe_int(cells[3]) if len(cells) > 3 else 0,
-                'fg_pct': self._safe_float(cells[4]) if len(cells) > 4 else 0.0,
-                'fg3': self._safe_int(cells[5]) if len(cells) > 5 else 0,
-                'fg3a': self._safe_int(cells[6]) if len(cells) > 6 else 0,
-                'fg3_pct': self._safe_float(cells[7]) if len(cells) > 7 else 0.0,
-                'ft': self._safe_int(cells[8]) if len(cells) > 8 else 0,
-                'fta': self._safe_int(cells[9]) if len(cells) > 9 else 0,
-                'ft_pct': self._safe_float(cells[10]) if len(cells) > 10 else 0.0,
-                'orb': self._safe_int(cells[11]) if len(cells) > 11 else 0,
-                'drb': self._safe_int(cells[12]) if len(cells) > 12 else 0,
-                'trb': self._safe_int(cells[13]) if len(cells) > 13 else 0,
-                'ast': self._safe_int(cells[14]) if len(cells) > 14 else 0,
-                'stl': self._safe_int(cells[15]) if len(cells) > 15 else 0,
-                'blk': self._safe_int(cells[16]) if len(cells) > 16 else 0,
-                'tov': self._safe_int(cells[17]) if len(cells) > 17 else 0,
-                'pf': self._safe_int(cells[18]) if len(cells) > 18 else 0,
-                'pts': self._safe_int(cells[19]) if len(cells) > 19 else 0,
-                'plus_minus': self._safe_int(cells[20]) if len(cells) > 20 else 0,
+                'mp': cells[1],
+                'fg': _to_int(cells[2]),
+                'fga': _to_int(cells[3]),
+                'fg_pct': _to_float(cells[4]),
+                'fg3': _to_int(cells[5]),
+                'fg3a': _to_int(cells[6]),
+                'fg3_pct': _to_float(cells[7]),
+                'ft': _to_int(cells[8]),
+                'fta': _to_int(cells[9]),
+                'ft_pct': _to_float(cells[10]),
+                'orb': _to_int(cells[11]),
+                'drb': _to_int(cells[12]),
+                'trb': _to_int(cells[13]),
+                'ast': _to_int(cells[14]),
+                'stl': _to_int(cells[15]),
+                'blk': _to_int(cells[16]),
+                'tov': _to_int(cells[17]),
+                'pf': _to_int(cells[18]),
+                'pts': _to_int(cells[19]),
+                'plus_minus': _to_int(cells[20]),
             }
-            
+
             return stats
             
         except Exception as e:
@@ -743,15 +1038,15 @@ class EnhancedBasketballScraper:
         stats = {}
         
         try:
-            if not table:
+            if table is None:
                 return stats
-            
-            rows = table.find_all('tr')
+
+            rows = table.xpath('.//tr')
             if not rows:
                 return stats
-            
+
             totals_row = rows[-1]
-            cells = totals_row.find_all(['td', 'th'])
+            cells = _row_cells(totals_row)
             
             if stat_type == 'basic':
                 stat_mapping = {
@@ -768,55 +1063,62 @@ class EnhancedBasketballScraper:
                     13: 'off_rtg', 14: 'def_rtg', 15: 'bpm'
                 }
             
-            for i, cell in enumerate(cells[1:], 1):
+            for i, value in enumerate(cells[1:], 1):
                 if i in stat_mapping:
                     stat_name = stat_mapping[i]
-                    value = cell.get_text(strip=True)
-                    
+
                     if stat_type == 'basic':
                         if 'pct' in stat_name:
-                            stats[stat_name] = self._safe_float(value)
+                            stats[stat_name] = _to_float(value)
                         else:
-                            stats[stat_name] = self._safe_int(value)
+                            stats[stat_name] = _to_int(value)
                     else:
-                        stats[stat_name] = self._safe_float(value)
+                        stats[stat_name] = _to_float(value)
             
-            # Add max stats for basic stats
+            # Add max stats for basic stats, reduced across all player
+            # rows at once instead of a Python max per cell
             if stat_type == 'basic':
-                for row in rows[1:-1]:
-                    cells = row.find_all(['td', 'th'])
-                    for j, cell in enumerate(cells[1:], 1):
-                        if j in stat_mapping:
-                            stat_name = stat_mapping[j] + '_max'
-                            value = cell.get_text(strip=True)
-                            
-                            if 'pct' in stat_mapping[j]:
-                                current_max = stats.get(stat_name, 0.0)
-                                new_value = self._safe_float(value)
-                                stats[stat_name] = max(current_max, new_value)
-                            else:
-                                current_max = stats.get(stat_name, 0)
-                                new_value = self._safe_int(value)
-                                stats[stat_name] = max(current_max, new_value)
+                n_cols = len(stat_mapping)
+                player_rows = [c[1:n_cols + 1] for c in
+                               (_row_cells(row) for row in rows[1:-1])
+                               if len(c) > n_cols]
+                if player_rows:
+                    cells_arr = np.array(player_rows, dtype=object)
+                    int_idx = [i - 1 for i, name in stat_mapping.items() if 'pct' not in name]
+                    pct_idx = [i - 1 for i, name in stat_mapping.items() if 'pct' in name]
+                    int_maxes = np.fromiter(
+                        (_to_int(v) for v in cells_arr[:, int_idx].ravel()),
+                        dtype=np.int32,
+                        count=len(player_rows) * len(int_idx)
+                    ).reshape(len(player_rows), -1).max(axis=0)
+                    pct_maxes = np.fromiter(
+                        (_to_float(v) for v in cells_arr[:, pct_idx].ravel()),
+                        dtype=np.float64,
+                        count=len(player_rows) * len(pct_idx)
+                    ).reshape(len(player_rows), -1).max(axis=0)
+                    for i, value in zip(int_idx, int_maxes):
+                        stats[stat_mapping[i + 1] + '_max'] = int(value)
+                    for i, value in zip(pct_idx, pct_maxes):
+                        stats[stat_mapping[i + 1] + '_max'] = float(value)
                                 
         except Exception as e:
             logger.error(f"Error parsing {stat_type} stats table: {e}")
         
         return stats
     
-    def _parse_officials(self, soup: BeautifulSoup, game_id: str) -> List[Dict]:
+    def _parse_officials(self, doc, game_id: str) -> List[Dict]:
         """Parse game officials"""
         officials = []
-        
+
         try:
-            officials_div = soup.find('div', string=lambda text: 'Officials:' in str(text) if text else False)
-            
-            if officials_div:
-                official_links = officials_div.find_next_siblings('a')
+            officials_div = _find_labeled_div(doc, 'Officials:')
+
+            if officials_div is not None:
+                official_links = officials_div.xpath('following-sibling::a')
                 for i, official in enumerate(official_links[:3], 1):
                     official_data = {
                         'game_id': game_id,
-                        'official_name': official.get_text(strip=True),
+                        'official_name': official.text_content().strip(),
                         'official_url': official.get('href', ''),
                         'position': i
                     }
@@ -827,21 +1129,14 @@ class EnhancedBasketballScraper:
         
         return officials
     
-    def _safe_int(self, cell) -> int:
+    # Kept for external callers; the hot paths use the module functions
+    def _safe_int(self, text: str) -> int:
         """Safely convert cell text to integer"""
-        try:
-            text = cell.get_text(strip=True)
-            return int(text) if text and text != '' else 0
-        except (ValueError, AttributeError):
-            return 0
-    
-    def _safe_float(self, cell) -> float:
+        return _to_int(text)
+
+    def _safe_float(self, text: str) -> float:
         """Safely convert cell text to float"""
-        try:
-            text = cell.get_text(strip=True)
-            return float(text) if text and text != '' else 0.0
-        except (ValueError, AttributeError):
-            return 0.0
+        return _to_float(text)
 
 async def main():
     """Main function to scrape comprehensive data"""
@@ -858,20 +1153,34 @@ async def main():
         logger.info("Scraping recent seasons for testing data...")
         all_game_urls = await scraper.scrape_recent_seasons(seasons_to_scrape)
         
-        # Scrape all games
+        # Scrape all games concurrently; the scraper's own semaphore and
+        # per-host token bucket keep the request rate bounded
         total_games = 0
+
+        async def process_game(url: str) -> bool:
+            game_data = await scraper.scrape_comprehensive_game_data(url)
+            if game_data:
+                await save_comprehensive_game_data(game_data)
+                return True
+            return False
+
         for season, game_urls in all_game_urls.items():
             logger.info(f"Processing {len(game_urls)} games for season {season}")
-            
-            for url in game_urls:
-                game_data = await scraper.scrape_comprehensive_game_data(url)
-                if game_data:
-                    await save_comprehensive_game_data(game_data)
+
+            results = await asyncio.gather(
+                *(process_game(url) for url in game_urls),
+                return_exceptions=True
+            )
+            for url, result in zip(game_urls, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error processing {url}: {result}")
+                elif result:
                     total_games += 1
-                
-                if total_games % 50 == 0:
-                    logger.info(f"Processed {total_games} games so far")
-        
+            logger.info(f"Processed {total_games} games so far")
+
+        # Push out any partial batch before moving on
+        await flush_game_buffer()
+
         # Scrape additional data sources
         logger.info("Scraping additional data sources...")
         
@@ -886,69 +1195,116 @@ async def main():
         
         logger.info(f"Comprehensive scraping complete! Processed {total_games} games")
 
-async def save_comprehensive_game_data(game_data: Dict):
-    """Save comprehensive game data to database"""
-    from models import Game, TeamGameStats, GameOfficial, PlayerGameStats, SessionLocal
-    
+# Worker-process scraper, created once per worker on first use; only its
+# parsing methods run there, never the network side
+_worker_scraper = None
+
+def _parse_all(html: str, game_id: str) -> Optional[Dict]:
+    """Parse one game page into a plain dict; runs in a pool worker
+
+    Top-level so it pickles; takes the HTML string and returns plain
+    dicts, so nothing heavyweight crosses the process boundary.
+    """
+    global _worker_scraper
+    if _worker_scraper is None:
+        _worker_scraper = EnhancedBasketballScraper()
+    scraper = _worker_scraper
+
+    doc = _parse_doc(html)
+    game_data = scraper._parse_basic_game_info(doc, game_id)
+    if not game_data:
+        return None
+
+    # Index every table by id in one walk; the stat parsers then look
+    # tables up in O(1) instead of re-traversing the tree per id
+    tables = {t.get('id'): t for t in doc.iter('table') if t.get('id')}
+    game_data['team_stats'] = scraper._parse_team_stats(tables, game_id)
+    game_data['player_stats'] = scraper._parse_player_stats(tables, game_id)
+    game_data['officials'] = scraper._parse_officials(doc, game_id)
+    game_data.update(scraper._parse_additional_data(doc, game_id))
+    return game_data
+
+# Columns of a game_data dict that belong on the games table; the rest
+# (team_stats, player_stats, officials, additional data) go elsewhere
+_GAME_COLUMNS = ('game_id', 'date', 'season', 'home_team', 'away_team',
+                 'home_score', 'away_score', 'home_won')
+
+# Games accumulate here and are written in batches; per-game ORM commits
+# were the write bottleneck once scraping ran concurrently
+_game_buffer: List[Dict] = []
+
+def _flush_games(games: List[Dict]):
+    """Write a batch of games with Core executemany, skipping known ids"""
     db = SessionLocal()
     try:
-        # Check if game already exists
-        existing_game = db.query(Game).filter(Game.game_id == game_data['game_id']).first()
-        if existing_game:
-            logger.debug(f"Game {game_data['game_id']} already exists, skipping")
+        ids = [g['game_id'] for g in games]
+        existing = set(
+            db.execute(select(Game.game_id).where(Game.game_id.in_(ids))).scalars()
+        )
+
+        game_rows, team_rows, player_rows, official_rows = [], [], [], []
+        for g in games:
+            if g['game_id'] in existing:
+                logger.debug(f"Game {g['game_id']} already exists, skipping")
+                continue
+            game_rows.append({c: g[c] for c in _GAME_COLUMNS})
+            team_rows.extend(g.get('team_stats', []))
+            player_rows.extend(g.get('player_stats', []))
+            official_rows.extend(g.get('officials', []))
+
+        if not game_rows:
             return
-        
-        # Create game record
-        game = Game(**game_data)
-        db.add(game)
-        db.commit()
-        
-        # Add team stats
-        for team_stat in game_data.get('team_stats', []):
-            team_game_stat = TeamGameStats(**team_stat)
-            db.add(team_game_stat)
-        
-        # Add player stats
-        for player_stat in game_data.get('player_stats', []):
-            player_game_stat = PlayerGameStats(**player_stat)
-            db.add(player_game_stat)
-        
-        # Add officials
-        for official in game_data.get('officials', []):
-            game_official = GameOfficial(**official)
-            db.add(game_official)
-        
+
+        db.execute(Game.__table__.insert(), game_rows)
+        if team_rows:
+            db.execute(TeamGameStats.__table__.insert(), team_rows)
+        if player_rows:
+            db.execute(PlayerGameStats.__table__.insert(), player_rows)
+        if official_rows:
+            db.execute(GameOfficial.__table__.insert(), official_rows)
         db.commit()
-        logger.info(f"Saved comprehensive game {game_data['game_id']} to database")
-        
+        logger.info(f"Saved batch of {len(game_rows)} games to database")
+
     except Exception as e:
-        logger.error(f"Error saving game {game_data.get('game_id', 'unknown')}: {e}")
+        logger.error(f"Error saving game batch: {e}")
         db.rollback()
     finally:
         db.close()
 
+async def save_comprehensive_game_data(game_data: Dict, flush_every: int = 100):
+    """Buffer a game for insertion, flushing in batches off the event loop"""
+    _game_buffer.append(game_data)
+    if len(_game_buffer) >= flush_every:
+        await flush_game_buffer()
+
+async def flush_game_buffer():
+    """Write whatever is buffered; call on shutdown to avoid losing a tail"""
+    if not _game_buffer:
+        return
+    batch = list(_game_buffer)
+    _game_buffer.clear()
+    # The DB write is sync SQLAlchemy; run it in a thread so in-flight
+    # page loads keep going while the batch commits
+    await asyncio.to_thread(_flush_games, batch)
+
 async def save_team_rosters(rosters: Dict, season: int):
     """Save team rosters to database"""
     # This would require additional database models for rosters
     # For now, save to JSON file
-    import json
-    
     roster_file = f"data/rosters_{season}.json"
-    with open(roster_file, 'w') as f:
-        json.dump(rosters, f, indent=2)
-    
+    async with aiofiles.open(roster_file, 'wb') as f:
+        await f.write(orjson.dumps(rosters, option=orjson.OPT_INDENT_2))
+
     logger.info(f"Saved rosters for {len(rosters)} teams to {roster_file}")
 
 async def save_historical_data(historical_data: Dict):
     """Save historical data to database/files"""
-    import json
-    
     # Save to JSON files for now
     for key, data in historical_data.items():
         filename = f"data/{key}.json"
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
-    
+        async with aiofiles.open(filename, 'wb') as f:
+            await f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
     logger.info(f"Saved {len(historical_data)} historical data files")
 
 if __name__ == "__main__":
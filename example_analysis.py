@@ -66,30 +66,28 @@ def analyze_recent_games():
     
     db = DatabaseManager()
     
-    # Get recent games
-    recent_games = db.get_games_by_date_range(
+    # Get recent games as typed score columns, not ORM objects
+    games = db.get_games_frame_by_date_range(
         date(2023, 12, 1),
         date(2023, 12, 31)
     )
-    
+
     print(f"\nRecent Games Analysis (December 2023):")
-    print(f"Total games: {len(recent_games)}")
-    
-    if recent_games:
-        # Calculate average scores
-        home_scores = [game.home_score for game in recent_games]
-        away_scores = [game.away_score for game in recent_games]
-        
-        avg_home_score = sum(home_scores) / len(home_scores)
-        avg_away_score = sum(away_scores) / len(away_scores)
-        
+    print(f"Total games: {len(games)}")
+
+    if not games.empty:
+        # Calculate average scores in one vectorized pass per column
+        avg_home_score = games['home_score'].mean()
+        avg_away_score = games['away_score'].mean()
+
         print(f"Average home team score: {avg_home_score:.1f}")
         print(f"Average away team score: {avg_away_score:.1f}")
         print(f"Home court advantage: {avg_home_score - avg_away_score:.1f} points")
-        
-        # Find highest scoring game
-        highest_scoring = max(recent_games, key=lambda g: g.home_score + g.away_score)
-        print(f"Highest scoring game: {highest_scoring.away_team} {highest_scoring.away_score} @ {highest_scoring.home_team} {highest_scoring.home_score}")
+
+        # Find highest scoring game via argmax over the score arrays
+        totals = games['home_score'].to_numpy() + games['away_score'].to_numpy()
+        highest_scoring = games.iloc[int(totals.argmax())]
+        print(f"Highest scoring game: {highest_scoring['away_team']} {highest_scoring['away_score']} @ {highest_scoring['home_team']} {highest_scoring['home_score']}")
 
 def analyze_team_stats():
     """Analyze team statistics"""
@@ -102,7 +100,9 @@ def analyze_team_stats():
     season = 2023
     
     try:
-        team_stats = db.get_team_stats(team, season)
+        # Only these five stats are reduced below, so only fetch them
+        team_stats = db.get_team_stats(
+            team, season, columns=['pts', 'fg_pct', 'fg3_pct', 'trb', 'ast'])
         
         if not team_stats.empty:
             print(f"\n{team} {season} Season Statistics:")
@@ -8,35 +8,27 @@ import subprocess
 import sys
 from pathlib import Path
 
-def check_git_installed():
-    """Check if git is installed"""
-    try:
-        subprocess.run(['git', '--version'], check=True, capture_output=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
-
 def init_git_repo():
     """Initialize git repository"""
-    if not check_git_installed():
-        print("❌ Git is not installed. Please install git first.")
-        return False
-    
     try:
-        # Initialize git repository
-        subprocess.run(['git', 'init'], check=True)
+        # -b main names the branch at init time, so no separate
+        # 'git branch -M main' process is needed later
+        subprocess.run(['git', 'init', '-b', 'main'], check=True)
         print("✅ Git repository initialized")
-        
+
         # Add all files
         subprocess.run(['git', 'add', '.'], check=True)
         print("✅ Files added to git")
-        
+
         # Initial commit
         subprocess.run(['git', 'commit', '-m', 'Initial NBA data scraping system'], check=True)
         print("✅ Initial commit created")
-        
+
         return True
-        
+
+    except FileNotFoundError:
+        print("❌ Git is not installed. Please install git first.")
+        return False
     except subprocess.CalledProcessError as e:
         print(f"❌ Git error: {e}")
         return False
@@ -66,14 +58,10 @@ def setup_github_remote():
     remote_url = f"https://github.com/{username}/{repo_name}.git"
     
     try:
-        # Add remote
+        # Add remote (the branch is already 'main' from git init -b)
         subprocess.run(['git', 'remote', 'add', 'origin', remote_url], check=True)
         print(f"✅ Remote added: {remote_url}")
-        
-        # Set main branch
-        subprocess.run(['git', 'branch', '-M', 'main'], check=True)
-        print("✅ Main branch set")
-        
+
         # Push to GitHub
         subprocess.run(['git', 'push', '-u', 'origin', 'main'], check=True)
         print("✅ Code pushed to GitHub!")
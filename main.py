@@ -10,7 +10,7 @@ from pathlib import Path
 from loguru import logger
 import sys
 
-from config import settings
+from config import settings, ensure_directories
 from models import create_tables
 from scraper import BasketballScraper
 from data_processor import DataProcessor
@@ -175,8 +175,9 @@ def main():
     
     # Setup logging
     setup_logging()
-    
-    # Create database tables
+
+    # Create directories and database tables
+    ensure_directories()
     create_tables()
     
     if args.command == "setup":
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, UniqueConstraint
+from sqlalchemy import create_engine, event, Column, Index, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 from datetime import datetime
@@ -12,8 +12,11 @@ class Game(Base):
     
     id = Column(Integer, primary_key=True)
     game_id = Column(String(50), unique=True, nullable=False)
-    date = Column(DateTime, nullable=False)
-    season = Column(Integer, nullable=False)
+    # Indexed: date-range queries and the MIN/MAX stats lookup scan this
+    date = Column(DateTime, nullable=False, index=True)
+    # Indexed: season filters are on nearly every query, and DISTINCT
+    # season becomes an index skip scan
+    season = Column(Integer, nullable=False, index=True)
     home_team = Column(String(10), nullable=False)
     away_team = Column(String(10), nullable=False)
     home_score = Column(Integer, nullable=False)
@@ -24,7 +27,13 @@ class Game(Base):
     home_stats = relationship("TeamGameStats", foreign_keys="TeamGameStats.home_game_id", back_populates="home_game")
     away_stats = relationship("TeamGameStats", foreign_keys="TeamGameStats.away_game_id", back_populates="away_game")
     officials = relationship("GameOfficial", back_populates="game")
-    
+
+    # Composite indexes backing the per-team game lookups
+    __table_args__ = (
+        Index('ix_games_home_team_season', 'home_team', 'season'),
+        Index('ix_games_away_team_season', 'away_team', 'season'),
+    )
+
     def __repr__(self):
         return f"<Game(id={self.id}, {self.away_team}@{self.home_team}, {self.date})>"
 
@@ -125,7 +134,8 @@ class PlayerGameStats(Base):
     id = Column(Integer, primary_key=True)
     game_id = Column(String(50), nullable=False)
     team = Column(String(10), nullable=False)
-    player_name = Column(String(100), nullable=False)
+    # Indexed: every player lookup filters on this column
+    player_name = Column(String(100), nullable=False, index=True)
     player_url = Column(String(500))
     
     # Basic stats
@@ -174,9 +184,31 @@ class PlayerGameStats(Base):
     def __repr__(self):
         return f"<PlayerGameStats(player={self.player_name}, team={self.team}, game_id={self.game_id})>"
 
+def configure_sqlite(engine):
+    """Apply performance PRAGMAs to every connection of a SQLite engine
+
+    Write side: WAL lets readers run during a bulk load and
+    synchronous=NORMAL drops the fsync per commit, which dominates write
+    time on a local database. Read side: mmap the database file and grow
+    the page cache so analytics scans stay off the syscall path.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        cursor.close()
+
 # Database setup
 engine = create_engine(settings.DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+configure_sqlite(engine)
 
 def create_tables():
     """Create all tables in the database"""
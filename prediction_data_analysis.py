@@ -64,38 +64,34 @@ class PredictionDataAnalyzer:
         """Analyze game distribution throughout the season"""
         print(f"\nGame Distribution Analysis ({season}):")
         
-        # Convert to DataFrame for easier analysis
-        game_data = []
-        for game in games:
-            game_data.append({
-                'date': game.date,
-                'home_team': game.home_team,
-                'away_team': game.away_team,
-                'home_score': game.home_score,
-                'away_score': game.away_score,
-                'total_score': game.home_score + game.away_score,
-                'point_diff': abs(game.home_score - game.away_score),
-                'home_won': game.home_won
-            })
-        
-        df = pd.DataFrame(game_data)
-        
+        # Build the frame in one shot and derive columns vectorized
+        # instead of computing per-game in a Python loop
+        df = pd.DataFrame(
+            [(g.date, g.home_team, g.away_team, g.home_score, g.away_score, g.home_won)
+             for g in games],
+            columns=['date', 'home_team', 'away_team',
+                     'home_score', 'away_score', 'home_won']
+        )
+        df['total_score'] = df['home_score'] + df['away_score']
+        df['point_diff'] = (df['home_score'] - df['away_score']).abs()
+
         # Monthly distribution
         df['month'] = df['date'].dt.month
         monthly_games = df.groupby('month').size()
         print(f"Games per month: {dict(monthly_games)}")
-        
+
         # Home court advantage
         home_wins = df['home_won'].sum()
         total_games = len(df)
         home_win_rate = home_wins / total_games
         print(f"Home court advantage: {home_win_rate:.3f} ({home_wins}/{total_games})")
-        
-        # Scoring statistics
-        print(f"Average total score: {df['total_score'].mean():.1f}")
-        print(f"Average point differential: {df['point_diff'].mean():.1f}")
-        print(f"Highest scoring game: {df['total_score'].max()}")
-        print(f"Lowest scoring game: {df['total_score'].min()}")
+
+        # Scoring statistics off one contiguous array
+        totals = df['total_score'].to_numpy()
+        print(f"Average total score: {totals.mean():.1f}")
+        print(f"Average point differential: {df['point_diff'].to_numpy().mean():.1f}")
+        print(f"Highest scoring game: {totals.max()}")
+        print(f"Lowest scoring game: {totals.min()}")
     
     def _analyze_team_performance(self, season: int):
         """Analyze team performance for the season"""
@@ -120,12 +116,14 @@ class PredictionDataAnalyzer:
             for _, team in bottom_5.iterrows():
                 print(f"  {team['team']}: {team['wins']}-{team['losses']} ({team['win_pct']:.3f})")
             
-            # Performance statistics
+            # Performance statistics from one contiguous array instead
+            # of four pandas reduction passes with per-call overhead
+            win_pct = standings['win_pct'].to_numpy(np.float64)
             print(f"\nPerformance Statistics:")
-            print(f"  Best team win %: {standings['win_pct'].max():.3f}")
-            print(f"  Worst team win %: {standings['win_pct'].min():.3f}")
-            print(f"  Average win %: {standings['win_pct'].mean():.3f}")
-            print(f"  Standard deviation: {standings['win_pct'].std():.3f}")
+            print(f"  Best team win %: {win_pct.max():.3f}")
+            print(f"  Worst team win %: {win_pct.min():.3f}")
+            print(f"  Average win %: {win_pct.mean():.3f}")
+            print(f"  Standard deviation: {win_pct.std(ddof=1):.3f}")
             
         except Exception as e:
             logger.error(f"Error analyzing team performance for {season}: {e}")
@@ -147,17 +145,12 @@ class PredictionDataAnalyzer:
         """Analyze scoring trends throughout the season"""
         print(f"\nScoring Trends Analysis ({season}):")
         
-        # Convert to DataFrame
-        game_data = []
-        for game in games:
-            game_data.append({
-                'date': game.date,
-                'home_score': game.home_score,
-                'away_score': game.away_score,
-                'total_score': game.home_score + game.away_score
-            })
-        
-        df = pd.DataFrame(game_data)
+        # Convert to DataFrame, deriving the total vectorized
+        df = pd.DataFrame(
+            [(g.date, g.home_score, g.away_score) for g in games],
+            columns=['date', 'home_score', 'away_score']
+        )
+        df['total_score'] = df['home_score'] + df['away_score']
         df = df.sort_values('date')
         
         # Rolling average of total scores
@@ -244,41 +244,41 @@ async def save_comprehensive_game_data(game_data: Dict):
 
 async def save_team_rosters(rosters: Dict, season: int):
     """Save team rosters to files"""
-    import json
+    import orjson
     
     # Create data directory if it doesn't exist
     Path("data").mkdir(exist_ok=True)
     
     roster_file = f"data/rosters_{season}.json"
-    with open(roster_file, 'w') as f:
-        json.dump(rosters, f, indent=2)
+    with open(roster_file, 'wb') as f:
+        f.write(orjson.dumps(rosters, option=orjson.OPT_INDENT_2))
     
     logger.info(f"Saved rosters for {len(rosters)} teams to {roster_file}")
 
 async def save_historical_data(historical_data: Dict):
     """Save historical data to files"""
-    import json
+    import orjson
     
     # Create data directory if it doesn't exist
     Path("data").mkdir(exist_ok=True)
     
     for key, data in historical_data.items():
         filename = f"data/{key}.json"
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     
     logger.info(f"Saved {len(historical_data)} historical data files")
 
 async def save_player_profiles(player_profiles: List[Dict]):
     """Save player profiles to files"""
-    import json
+    import orjson
     
     # Create data directory if it doesn't exist
     Path("data").mkdir(exist_ok=True)
     
     profiles_file = "data/player_profiles.json"
-    with open(profiles_file, 'w') as f:
-        json.dump(player_profiles, f, indent=2)
+    with open(profiles_file, 'wb') as f:
+        f.write(orjson.dumps(player_profiles, option=orjson.OPT_INDENT_2))
     
     logger.info(f"Saved {len(player_profiles)} player profiles to {profiles_file}")
 
@@ -1,5 +1,7 @@
 import asyncio
 import aiohttp
+import lxml.html
+import numpy as np
 from bs4 import BeautifulSoup
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 from loguru import logger
@@ -10,9 +12,25 @@ from pathlib import Path
 import re
 from asyncio_throttle import Throttler
 
-from config import settings
+from sqlalchemy import exists
+
+from config import settings, ensure_directories
 from models import Game, TeamGameStats, GameOfficial, PlayerGameStats, SessionLocal
 
+def _to_int(text: str, default: int = 0) -> int:
+    """Convert stripped cell text to int, defaulting on blanks"""
+    try:
+        return int(text)
+    except ValueError:
+        return default
+
+def _to_float(text: str, default: float = 0.0) -> float:
+    """Convert stripped cell text to float, defaulting on blanks"""
+    try:
+        return float(text)
+    except ValueError:
+        return default
+
 class BasketballScraper:
     def __init__(self):
         self.throttler = Throttler(rate_limit=1, period=1)  # 1 request per second
@@ -84,7 +102,7 @@ class BasketballScraper:
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         links = soup.find_all("a")
         schedule_pages = [f"{settings.BASE_URL}{l['href']}" for l in links if l.get('href')]
         
@@ -94,7 +112,7 @@ class BasketballScraper:
             if not html:
                 continue
                 
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml')
             links = soup.find_all("a")
             box_scores = [
                 f"{settings.BASE_URL}{l['href']}" 
@@ -125,7 +143,7 @@ class BasketballScraper:
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         
         try:
             # Parse basic game info
@@ -279,41 +297,49 @@ class BasketballScraper:
     def _parse_player_row(self, row, game_id: str, team: str) -> Optional[Dict]:
         """Parse a single player row"""
         try:
-            cells = row.find_all(['td', 'th'])
+            # Extract every cell's text once; the stat lookups below then
+            # work on plain strings instead of walking the tree per cell
+            cells = [c.get_text(strip=True) for c in row.find_all(['td', 'th'])]
             if len(cells) < 10:  # Need minimum columns
                 return None
-            
-            player_name = cells[0].get_text(strip=True)
+
+            player_name = cells[0]
             if not player_name or player_name == 'Reserves' or player_name == 'Team Totals':
                 return None
-            
+
+            # Pad short rows once to the full box-score width; extraction
+            # below is then straight-line indexing with no per-field
+            # length guard (empty strings convert to the same defaults)
+            if len(cells) < 21:
+                cells = cells + [''] * (21 - len(cells))
+
             # Extract basic stats
             stats = {
                 'game_id': game_id,
                 'team': team,
                 'player_name': player_name,
-                'mp': cells[1].get_text(strip=True) if len(cells) > 1 else '0',
-                'fg': self._safe_int(cells[2]) if len(cells) > 2 else 0,
-                'fga': self._safe_int(cells[3]) if len(cells) > 3 else 0,
-                'fg_pct': self._safe_float(cells[4]) if len(cells) > 4 else 0.0,
-                'fg3': self._safe_int(cells[5]) if len(cells) > 5 else 0,
-                'fg3a': self._safe_int(cells[6]) if len(cells) > 6 else 0,
-                'fg3_pct': self._safe_float(cells[7]) if len(cells) > 7 else 0.0,
-                'ft': self._safe_int(cells[8]) if len(cells) > 8 else 0,
-                'fta': self._safe_int(cells[9]) if len(cells) > 9 else 0,
-                'ft_pct': self._safe_float(cells[10]) if len(cells) > 10 else 0.0,
-                'orb': self._safe_int(cells[11]) if len(cells) > 11 else 0,
-                'drb': self._safe_int(cells[12]) if len(cells) > 12 else 0,
-                'trb': self._safe_int(cells[13]) if len(cells) > 13 else 0,
-                'ast': self._safe_int(cells[14]) if len(cells) > 14 else 0,
-                'stl': self._safe_int(cells[15]) if len(cells) > 15 else 0,
-                'blk': self._safe_int(cells[16]) if len(cells) > 16 else 0,
-                'tov': self._safe_int(cells[17]) if len(cells) > 17 else 0,
-                'pf': self._safe_int(cells[18]) if len(cells) > 18 else 0,
-                'pts': self._safe_int(cells[19]) if len(cells) > 19 else 0,
-                'plus_minus': self._safe_int(cells[20]) if len(cells) > 20 else 0,
+                'mp': cells[1],
+                'fg': _to_int(cells[2]),
+                'fga': _to_int(cells[3]),
+                'fg_pct': _to_float(cells[4]),
+                'fg3': _to_int(cells[5]),
+                'fg3a': _to_int(cells[6]),
+                'fg3_pct': _to_float(cells[7]),
+                'ft': _to_int(cells[8]),
+                'fta': _to_int(cells[9]),
+                'ft_pct': _to_float(cells[10]),
+                'orb': _to_int(cells[11]),
+                'drb': _to_int(cells[12]),
+                'trb': _to_int(cells[13]),
+                'ast': _to_int(cells[14]),
+                'stl': _to_int(cells[15]),
+                'blk': _to_int(cells[16]),
+                'tov': _to_int(cells[17]),
+                'pf': _to_int(cells[18]),
+                'pts': _to_int(cells[19]),
+                'plus_minus': _to_int(cells[20]),
             }
-            
+
             return stats
             
         except Exception as e:
@@ -327,14 +353,18 @@ class BasketballScraper:
         try:
             if not table:
                 return stats
-            
-            # Find totals row (usually last row)
-            rows = table.find_all('tr')
-            if not rows:
+
+            # Convert once to lxml; a single C-level xpath per row pulls
+            # every cell text instead of a BS4 find_all per row
+            root = lxml.html.fromstring(str(table))
+            row_cells = [
+                [c.text_content().strip() for c in r.xpath('./td | ./th')]
+                for r in root.xpath('.//tr')
+            ]
+            if not row_cells:
                 return stats
-            
-            totals_row = rows[-1]  # Last row is usually totals
-            cells = totals_row.find_all(['td', 'th'])
+
+            cells = row_cells[-1]  # Last row is usually totals
             
             if stat_type == 'basic':
                 # Basic stats mapping
@@ -353,36 +383,42 @@ class BasketballScraper:
                     13: 'off_rtg', 14: 'def_rtg', 15: 'bpm'
                 }
             
-            for i, cell in enumerate(cells[1:], 1):  # Skip first column (team name)
+            for i, value in enumerate(cells[1:], 1):  # Skip first column (team name)
                 if i in stat_mapping:
                     stat_name = stat_mapping[i]
-                    value = cell.get_text(strip=True)
-                    
+
                     if stat_type == 'basic':
                         if 'pct' in stat_name:
-                            stats[stat_name] = self._safe_float(value)
+                            stats[stat_name] = _to_float(value)
                         else:
-                            stats[stat_name] = self._safe_int(value)
+                            stats[stat_name] = _to_int(value)
                     else:  # advanced
-                        stats[stat_name] = self._safe_float(value)
-            
-            # Add max stats for basic stats
+                        stats[stat_name] = _to_float(value)
+
+            # Add max stats for basic stats, reduced across all player
+            # rows at once instead of a Python max per cell
             if stat_type == 'basic':
-                for i, row in enumerate(rows[1:-1]):  # Skip header and totals
-                    cells = row.find_all(['td', 'th'])
-                    for j, cell in enumerate(cells[1:], 1):
-                        if j in stat_mapping:
-                            stat_name = stat_mapping[j] + '_max'
-                            value = cell.get_text(strip=True)
-                            
-                            if 'pct' in stat_mapping[j]:
-                                current_max = stats.get(stat_name, 0.0)
-                                new_value = self._safe_float(value)
-                                stats[stat_name] = max(current_max, new_value)
-                            else:
-                                current_max = stats.get(stat_name, 0)
-                                new_value = self._safe_int(value)
-                                stats[stat_name] = max(current_max, new_value)
+                n_cols = len(stat_mapping)
+                player_rows = [c[1:n_cols + 1] for c in row_cells[1:-1]
+                               if len(c) > n_cols]  # Skip header, totals, short rows
+                if player_rows:
+                    cells_arr = np.array(player_rows, dtype=object)
+                    int_idx = [i - 1 for i, name in stat_mapping.items() if 'pct' not in name]
+                    pct_idx = [i - 1 for i, name in stat_mapping.items() if 'pct' in name]
+                    int_maxes = np.fromiter(
+                        (_to_int(v) for v in cells_arr[:, int_idx].ravel()),
+                        dtype=np.int32,
+                        count=len(player_rows) * len(int_idx)
+                    ).reshape(len(player_rows), -1).max(axis=0)
+                    pct_maxes = np.fromiter(
+                        (_to_float(v) for v in cells_arr[:, pct_idx].ravel()),
+                        dtype=np.float64,
+                        count=len(player_rows) * len(pct_idx)
+                    ).reshape(len(player_rows), -1).max(axis=0)
+                    for i, value in zip(int_idx, int_maxes):
+                        stats[stat_mapping[i + 1] + '_max'] = int(value)
+                    for i, value in zip(pct_idx, pct_maxes):
+                        stats[stat_mapping[i + 1] + '_max'] = float(value)
                                 
         except Exception as e:
             logger.error(f"Error parsing {stat_type} stats table: {e}")
@@ -394,9 +430,15 @@ class BasketballScraper:
         officials = []
         
         try:
-            # Look for officials section
-            officials_div = soup.find('div', string=lambda text: 'Officials:' in str(text) if text else False)
-            
+            # Look for officials section; the CSS :-soup-contains match
+            # runs in soupsieve instead of calling a Python lambda on
+            # every string node. It also matches every ancestor whose
+            # descendant text contains the label, so take the last
+            # (innermost) hit — that's the label div the referee
+            # anchors follow
+            candidates = soup.select('div:-soup-contains("Officials:")')
+            officials_div = candidates[-1] if candidates else None
+
             if officials_div:
                 official_links = officials_div.find_next_siblings('a')
                 for i, official in enumerate(official_links[:3], 1):  # Max 3 officials
@@ -413,81 +455,85 @@ class BasketballScraper:
         
         return officials
     
-    def _safe_int(self, cell) -> int:
-        """Safely convert cell text to integer"""
-        try:
-            text = cell.get_text(strip=True)
-            return int(text) if text and text != '' else 0
-        except (ValueError, AttributeError):
-            return 0
-    
-    def _safe_float(self, cell) -> float:
-        """Safely convert cell text to float"""
-        try:
-            text = cell.get_text(strip=True)
-            return float(text) if text and text != '' else 0.0
-        except (ValueError, AttributeError):
-            return 0.0
-
 async def main():
     """Main scraping function"""
     logger.add("logs/scraper.log", rotation="1 day", retention="30 days")
-    
+    ensure_directories()
+
     async with BasketballScraper() as scraper:
         for season in range(settings.START_SEASON, settings.END_SEASON + 1):
             logger.info(f"Starting to scrape season {season}")
-            
+
             # Get all game URLs for the season
             game_urls = await scraper.scrape_season_schedule(season)
-            
-            # Scrape each game
-            for url in game_urls:
-                game_data = await scraper.scrape_game_data(url)
-                if game_data:
-                    # Save to database
-                    await save_game_to_database(game_data)
-                
-                # Small delay between games
-                await asyncio.sleep(0.5)
 
-async def save_game_to_database(game_data: Dict):
-    """Save scraped game data to database"""
-    db = SessionLocal()
+            # One session for the whole season; committing every 50
+            # games amortizes connection and transaction overhead
+            db = SessionLocal()
+            try:
+                saved = 0
+                for url in game_urls:
+                    game_data = await scraper.scrape_game_data(url)
+                    if game_data:
+                        if await save_game_to_database(game_data, db):
+                            saved += 1
+                            if saved % 50 == 0:
+                                _commit_batch(db, season)
+
+                    # Small delay between games
+                    await asyncio.sleep(0.5)
+                _commit_batch(db, season)
+            finally:
+                db.close()
+
+def _commit_batch(db, season: int):
+    """Commit the pending batch, logging instead of crashing the run"""
     try:
-        # Check if game already exists
-        existing_game = db.query(Game).filter(Game.game_id == game_data['game_id']).first()
-        if existing_game:
-            logger.info(f"Game {game_data['game_id']} already exists, skipping")
-            return
-        
-        # Create game record
-        game = Game(**game_data)
-        db.add(game)
-        db.commit()
-        
-        # Add team stats
-        for team_stat in game_data.get('team_stats', []):
-            team_game_stat = TeamGameStats(**team_stat)
-            db.add(team_game_stat)
-        
-        # Add player stats
-        for player_stat in game_data.get('player_stats', []):
-            player_game_stat = PlayerGameStats(**player_stat)
-            db.add(player_game_stat)
-        
-        # Add officials
-        for official in game_data.get('officials', []):
-            game_official = GameOfficial(**official)
-            db.add(game_official)
-        
         db.commit()
+    except Exception as e:
+        logger.error(f"Error committing batch for season {season}: {e}")
+        db.rollback()
+
+async def save_game_to_database(game_data: Dict, db) -> bool:
+    """Stage one scraped game on the caller's session
+
+    The caller owns the session lifecycle and commit cadence. Each game
+    is staged under its own SAVEPOINT, so a bad game rolls back alone
+    without touching the rest of the pending batch; releasing the
+    SAVEPOINT flushes the rows, which keeps the EXISTS probe honest for
+    duplicates arriving later in the same batch.
+    """
+    try:
+        # Scalar EXISTS probe; no point hydrating the full row just to
+        # throw it away (game_id is uniquely indexed, so this is an
+        # index-only lookup)
+        if db.query(exists().where(Game.game_id == game_data['game_id'])).scalar():
+            logger.info(f"Game {game_data['game_id']} already exists, skipping")
+            return False
+
+        with db.begin_nested():
+            # Create game record; the nested stat lists aren't Game columns
+            game_row = {k: v for k, v in game_data.items()
+                        if k not in ('team_stats', 'player_stats', 'officials')}
+            db.add(Game(**game_row))
+
+            # Batch the child rows into single bulk inserts instead of
+            # adding them to the session one at a time
+            db.bulk_save_objects(
+                [TeamGameStats(**s) for s in game_data.get('team_stats', [])])
+            db.bulk_save_objects(
+                [PlayerGameStats(**s) for s in game_data.get('player_stats', [])])
+            db.bulk_save_objects(
+                [GameOfficial(**o) for o in game_data.get('officials', [])])
+
         logger.info(f"Saved game {game_data['game_id']} to database")
-        
+        return True
+
     except Exception as e:
+        # The context manager already rolled back this game's SAVEPOINT;
+        # the rest of the batch stays staged
         logger.error(f"Error saving game {game_data.get('game_id', 'unknown')}: {e}")
-        db.rollback()
-    finally:
-        db.close()
+        return False
 
 if __name__ == "__main__":
     from models import create_tables